@@ -2,9 +2,10 @@
 # -*- coding: utf-8 -*-
 # =====================================================
 # @File   ：__init__.py
-# @Date   ：2025/01/09 18:30
+# @Date   ：2026/10/16 10:00
 # @Author ：leemysw
 # 2025/01/09 18:30   Create
+# 2026/10/16 10:00   Lazy-load FeishuExporter via module __getattr__
 # =====================================================
 """
 [INPUT]: None
@@ -22,6 +23,13 @@ warnings.filterwarnings("ignore", message=".*pkg_resources.*")
 
 __version__ = "0.1.3"
 
-from feishu_docx.core.exporter import FeishuExporter
-
 __all__ = ["__version__", "FeishuExporter"]
+
+
+def __getattr__(name: str):
+    # 延迟导入：仅读取 __version__ 时不加载 lark_oapi 等重依赖
+    if name == "FeishuExporter":
+        from feishu_docx.core.exporter import FeishuExporter
+
+        return FeishuExporter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,11 +2,12 @@
 # -*- coding: utf-8 -*-
 # =====================================================
 # @File   ：oauth.py
-# @Date   ：2026/01/28 12:05
+# @Date   ：2026/10/16 10:00
 # @Author ：leemysw
 # 2025/01/09 18:30   Create
 # 2026/01/28 11:25   Add upload scopes
 # 2026/01/28 12:05   Use safe console output
+# 2026/10/16 10:00   Reuse in-memory token, write cache atomically
 # =====================================================
 """
 [INPUT]: 依赖 httpx 的 HTTP 客户端，依赖 http.server 的本地回调服务器
@@ -20,6 +21,7 @@
 """
 
 import json
+import os
 import time
 import webbrowser
 from dataclasses import dataclass
@@ -256,6 +258,10 @@ class OAuth2Authenticator:
         Returns:
             user_access_token
         """
+        # 0. 内存中的 Token 仍有效，直接复用（避免重复读取缓存文件）
+        if self._token_info and not self._token_info.is_expired():
+            return self._token_info.access_token
+
         # 1. 尝试从缓存加载
         if self._load_from_cache():
             if not self._token_info.is_expired():
@@ -444,4 +450,7 @@ class OAuth2Authenticator:
             return
 
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_file.write_text(json.dumps(self._token_info.to_dict(), indent=2))
+        # 先写临时文件再原子替换，避免并发读取到半写入的缓存
+        tmp_file = self.cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(self._token_info.to_dict(), indent=2))
+        os.replace(tmp_file, self.cache_file)
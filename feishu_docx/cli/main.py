@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 # =====================================================
 # @File   ：main.py
-# @Date   ：2026/01/28 19:00
+# @Date   ：2026/10/16 10:00
 # @Author ：leemysw
 # 2025/01/09 18:30   Create
 # 2026/01/28 11:10   Support folder url parsing
@@ -10,6 +10,22 @@
 # 2026/01/28 16:00   Add whiteboard metadata export option
 # 2026/01/28 18:00   Add workspace schema and wiki batch export commands
 # 2026/01/28 19:00   Fix wiki export: support old doc format, preserve hierarchy
+# 2026/10/16 10:00   Lazy-load rich/exporter/oauth inside commands
+# 2026/10/16 10:00   Share exporter bootstrap via _build_exporter
+# 2026/10/16 10:00   Snapshot FEISHU_* env vars once per process
+# 2026/10/16 10:00   Stream --stdout export chunk by chunk
+# 2026/10/16 10:00   Share credential options across commands
+# 2026/10/16 10:00   Export wiki space concurrently with a thread pool
+# 2026/10/16 10:00   Skip unchanged wiki documents via sidecar cache
+# 2026/10/16 10:00   Wiki export progress bar, per-node logs behind --verbose
+# 2026/10/16 10:00   Lazy-load AppConfig in config commands
+# 2026/10/16 10:00   config show: one scandir for cache file checks
+# 2026/10/16 10:00   config show: plain text output when not a TTY
+# 2026/10/16 10:00   Drop lru_cache on _build_exporter
+# 2026/10/16 10:00   Dedupe sibling names; count listing failures
+# 2026/10/16 10:00   Cache the path returned by export()
+# 2026/10/16 10:00   Re-export renamed/moved wiki nodes
+# 2026/10/16 10:00   Folder token: ignore query string and fragment
 # =====================================================
 """
 [INPUT]: 依赖 typer 的 CLI 框架，依赖 feishu_docx.core.exporter 的导出器
@@ -18,24 +34,62 @@
 [PROTOCOL]: 变更时更新此头部，然后检查 CLAUDE.md
 """
 
+import json
 import os
 import re
+import sys
+import threading
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
-from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.panel import Panel
-from rich.table import Table
 
 from feishu_docx import __version__
-from feishu_docx.auth.oauth import OAuth2Authenticator
-from feishu_docx.core.exporter import FeishuExporter
-from feishu_docx.utils.config import AppConfig, get_config_dir
 from feishu_docx.utils.console import get_console
 
+if TYPE_CHECKING:
+    from feishu_docx.core.exporter import FeishuExporter
+
 console = get_console()
 
+# 文件夹 token / URL 匹配
+_FOLDER_TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+_FOLDER_PATH_MARKER = "/drive/folder/"
+
+# 数据库结构表格模板
+_SCHEMA_TABLE_TMPL = (
+    "\n## 📋 {name}\n\n"
+    "{desc}"
+    "| 列名 | 类型 | 主键 | 唯一 | 自增 | 数组 | 允许空 | 默认值 | 描述 |\n"
+    "|------|------|------|------|------|------|--------|--------|------|\n"
+    "{rows}"
+)
+_SCHEMA_DESC_TMPL = "> {}\n\n"
+_SCHEMA_ROW_FMT = "| {} | {} | {} | {} | {} | {} | {} | {} | {} |\n"
+_CHECK = ("", "✓")
+_SCHEMA_COLUMN_KEYS = (
+    "name", "data_type", "is_primary_key", "is_unique", "is_auto_increment",
+    "is_array", "is_allow_null", "default_value", "description",
+)
+_SCHEMA_COLUMN_DEFAULTS = dict.fromkeys(_SCHEMA_COLUMN_KEYS, "")
+_SCHEMA_COLUMN_FIELDS = itemgetter(*_SCHEMA_COLUMN_KEYS)
+
+# 知识空间中可导出的文档类型
+_WIKI_DOC_TYPES = frozenset(("doc", "docx", "sheet", "bitable"))
+
+# 文件名非法字符替换表（兼容 Windows 保留字符）
+_SAFE_TITLE_TABLE = str.maketrans({c: "_" for c in '/\\:*?"<>|'})
+
+# 知识空间增量导出缓存文件名（位于输出目录下）
+_EXPORT_CACHE_NAME = ".feishu-docx-cache.json"
+
+# 默认输出路径
+_DEFAULT_OUTPUT = Path("./output")
+_DEFAULT_SCHEMA_OUTPUT = Path("./database_schema.md")
+_DEFAULT_WIKI_OUTPUT = Path("./wiki_export")
+
 # ==============================================================================
 # 创建 Typer 应用
 # ==============================================================================
@@ -48,9 +102,33 @@ app = typer.Typer(
 )
 
 
+# ==============================================================================
+# 共享选项（create/write/update/schema/wiki 复用同一组 OptionInfo）
+# ==============================================================================
+TOKEN_OPTION = typer.Option(
+    None,
+    "-t",
+    "--token",
+    envvar="FEISHU_ACCESS_TOKEN",
+    help="用户访问凭证",
+)
+APP_ID_OPTION = typer.Option(None, "--app-id", help="飞书应用 App ID")
+APP_SECRET_OPTION = typer.Option(None, "--app-secret", help="飞书应用 App Secret")
+LARK_OPTION = typer.Option(False, "--lark", help="使用 Lark (海外版)")
+
+
 # ==============================================================================
 # 辅助函数
 # ==============================================================================
+_ENV_KEYS = ("FEISHU_APP_ID", "FEISHU_APP_SECRET", "FEISHU_ACCESS_TOKEN")
+
+
+@lru_cache(maxsize=1)
+def _env() -> dict[str, Optional[str]]:
+    """环境变量快照（单次 CLI 调用内环境变量不会变化）"""
+    return {key: os.environ.get(key) for key in _ENV_KEYS}
+
+
 def get_credentials(
         app_id: Optional[str] = None,
         app_secret: Optional[str] = None,
@@ -64,16 +142,21 @@ def get_credentials(
     # 1. 命令行参数优先
     final_app_id = app_id
     final_app_secret = app_secret
+    if final_app_id and final_app_secret:
+        return final_app_id, final_app_secret
 
     # 2. 环境变量次之
+    env = _env()
     if not final_app_id:
-        final_app_id = os.getenv("FEISHU_APP_ID")
+        final_app_id = env["FEISHU_APP_ID"]
     if not final_app_secret:
-        final_app_secret = os.getenv("FEISHU_APP_SECRET")
+        final_app_secret = env["FEISHU_APP_SECRET"]
 
     # 3. 配置文件最后
     if not final_app_id or not final_app_secret:
-        config = AppConfig.load()
+        from feishu_docx.utils.config import AppConfig
+
+        config = AppConfig.load_cached()
         if not final_app_id:
             final_app_id = config.app_id
         if not final_app_secret:
@@ -82,23 +165,96 @@ def get_credentials(
     return final_app_id, final_app_secret
 
 
+def _build_exporter(
+        token: Optional[str],
+        app_id: Optional[str],
+        app_secret: Optional[str],
+        lark: bool,
+) -> tuple["FeishuExporter", str]:
+    """
+    创建导出器并获取访问凭证（token 优先，否则走应用凭证）
+
+    Returns:
+        (exporter, access_token)
+    """
+    from feishu_docx.core.exporter import FeishuExporter
+
+    if token:
+        return FeishuExporter.from_token(token), token
+
+    final_app_id, final_app_secret = get_credentials(app_id, app_secret)
+    if not final_app_id or not final_app_secret:
+        console.print("[red]❌ 需要提供凭证，请运行 feishu-docx config set[/red]")
+        raise typer.Exit(1)
+    exporter = FeishuExporter(app_id=final_app_id, app_secret=final_app_secret, is_lark=lark)
+    return exporter, exporter.get_access_token()
+
+
+@lru_cache(maxsize=128)
 def normalize_folder_token(folder: Optional[str]) -> Optional[str]:
     if not folder:
         return None
-    if re.match(r"^[A-Za-z0-9]+$", folder):
+    # 纯 ASCII 字母数字即为 token（isascii 排除 Unicode 字母数字）
+    if folder.isascii() and folder.isalnum():
         return folder
-    try:
-        parsed = urlparse(folder)
-        if not parsed.path:
-            return folder
-        match = re.search(r"/drive/folder/([A-Za-z0-9]+)", parsed.path)
+    # 飞书文件夹 URL 格式固定，直接定位路径标记，无需完整 URL 解析
+    # 只在路径部分查找：截止到第一个 ? 或 #，不匹配查询串/锚点中的标记
+    end = len(folder)
+    for sep in "?#":
+        pos = folder.find(sep, 0, end)
+        if pos >= 0:
+            end = pos
+    idx = folder.find(_FOLDER_PATH_MARKER, 0, end)
+    if idx >= 0:
+        match = _FOLDER_TOKEN_RE.match(folder, idx + len(_FOLDER_PATH_MARKER))
         if match:
-            return match.group(1)
-    except Exception:
-        return folder
+            return match.group()
     return folder
 
 
+def _mask(value: str, head: int = 10, tail: int = 4) -> str:
+    """脱敏显示：保留首尾字符，中间以 ... 代替"""
+    if len(value) <= head + tail:
+        return value
+    return f"{value[:head]}...{value[-tail:]}"
+
+
+def _unique_name(name: str, used: set[str]) -> str:
+    """同级重名时追加序号（忽略大小写），避免并发导出写入同一文件/资源目录"""
+    key = name.casefold()
+    if key in used:
+        index = 2
+        while f"{name}_{index}".casefold() in used:
+            index += 1
+        name = f"{name}_{index}"
+        key = name.casefold()
+    used.add(key)
+    return name
+
+
+def _load_export_cache(cache_file: Path) -> dict:
+    """读取知识空间增量导出缓存，文件不存在或损坏时返回空字典"""
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_export_cache(cache_file: Path, data: dict) -> None:
+    """原子写入知识空间增量导出缓存"""
+    tmp_file = cache_file.with_name(f"{cache_file.name}.tmp")
+    tmp_file.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp_file, cache_file)
+
+
+def _panel(*args, **kwargs):
+    """延迟导入 rich.panel.Panel，仅在需要输出面板时加载"""
+    from rich.panel import Panel
+
+    return Panel(*args, **kwargs)
+
+
 # ==============================================================================
 # 版本回调
 # ==============================================================================
@@ -137,7 +293,7 @@ def main(
 def export(
         url: str = typer.Argument(..., help="飞书文档 URL"),
         output: Path = typer.Option(
-            Path("./output"),
+            _DEFAULT_OUTPUT,
             "-o",
             "--output",
             help="输出目录",
@@ -219,6 +375,8 @@ def export(
         # 同时导出画板图片和元数据 \n
         feishu-docx export "https://xxx.feishu.cn/docx/xxx" --export-board-metadata
     """
+    from feishu_docx.core.exporter import FeishuExporter
+
     try:
         # 创建导出器
         if token:
@@ -243,13 +401,16 @@ def export(
 
         # 执行导出
         if stdout:
-            # 直接输出内容到 stdout
-            content = exporter.export_content(
-                url=url,
-                table_format=table_format,  # type: ignore
-                export_board_metadata=export_board_metadata,
-            )
-            print(content)
+            # 流式输出到 stdout，避免拼接完整文档
+            write = sys.stdout.write
+            for chunk in exporter.export_content_iter(
+                    url=url,
+                    table_format=table_format,  # type: ignore
+                    export_board_metadata=export_board_metadata,
+            ):
+                write(chunk)
+            write("\n")
+            sys.stdout.flush()
         else:
             # 保存到文件
             output_path = exporter.export(
@@ -260,7 +421,7 @@ def export(
                 with_block_ids=with_block_ids,
                 export_board_metadata=export_board_metadata,
             )
-            console.print(Panel(f"✅ 导出完成: [green]{output_path}[/green]", border_style="green"))
+            console.print(_panel(f"✅ 导出完成: [green]{output_path}[/green]", border_style="green"))
 
     except ValueError as e:
         console.print(f"[red]❌ 错误: {e}[/red]")
@@ -294,16 +455,10 @@ def create(
             "--folder",
             help="目标文件夹 token",
         ),
-        token: Optional[str] = typer.Option(
-            None,
-            "-t",
-            "--token",
-            envvar="FEISHU_ACCESS_TOKEN",
-            help="用户访问凭证",
-        ),
-        app_id: Optional[str] = typer.Option(None, "--app-id", help="飞书应用 App ID"),
-        app_secret: Optional[str] = typer.Option(None, "--app-secret", help="飞书应用 App Secret"),
-        lark: bool = typer.Option(False, "--lark", help="使用 Lark (海外版)"),
+        token: Optional[str] = TOKEN_OPTION,
+        app_id: Optional[str] = APP_ID_OPTION,
+        app_secret: Optional[str] = APP_SECRET_OPTION,
+        lark: bool = LARK_OPTION,
 ):
     """
     [green]▶[/] 创建飞书文档
@@ -323,18 +478,7 @@ def create(
         from feishu_docx.core.writer import FeishuWriter
 
         # 获取凭证
-        if token:
-            from feishu_docx import FeishuExporter
-            exporter = FeishuExporter.from_token(token)
-            access_token = token
-        else:
-            final_app_id, final_app_secret = get_credentials(app_id, app_secret)
-            if not final_app_id or not final_app_secret:
-                console.print("[red]❌ 需要提供凭证，请运行 feishu-docx config set[/red]")
-                raise typer.Exit(1)
-            from feishu_docx import FeishuExporter
-            exporter = FeishuExporter(app_id=final_app_id, app_secret=final_app_secret, is_lark=lark)
-            access_token = exporter.get_access_token()
+        exporter, access_token = _build_exporter(token, app_id, app_secret, lark)
 
         writer = FeishuWriter(sdk=exporter.sdk)
 
@@ -347,7 +491,7 @@ def create(
             user_access_token=access_token,
         )
 
-        console.print(Panel(
+        console.print(_panel(
             f"✅ 创建成功!\n\n"
             f"[blue]文档 ID:[/blue] {doc['document_id']}\n"
             f"[blue]链接:[/blue] {doc['url']}",
@@ -378,16 +522,10 @@ def write(
             help="Markdown 文件路径",
             exists=True,
         ),
-        token: Optional[str] = typer.Option(
-            None,
-            "-t",
-            "--token",
-            envvar="FEISHU_ACCESS_TOKEN",
-            help="用户访问凭证",
-        ),
-        app_id: Optional[str] = typer.Option(None, "--app-id", help="飞书应用 App ID"),
-        app_secret: Optional[str] = typer.Option(None, "--app-secret", help="飞书应用 App Secret"),
-        lark: bool = typer.Option(False, "--lark", help="使用 Lark (海外版)"),
+        token: Optional[str] = TOKEN_OPTION,
+        app_id: Optional[str] = APP_ID_OPTION,
+        app_secret: Optional[str] = APP_SECRET_OPTION,
+        lark: bool = LARK_OPTION,
 ):
     """
     [green]▶[/] 向飞书文档追加 Markdown 内容
@@ -406,19 +544,9 @@ def write(
 
     try:
         from feishu_docx.core.writer import FeishuWriter
-        from feishu_docx import FeishuExporter
 
         # 获取凭证
-        if token:
-            exporter = FeishuExporter.from_token(token)
-            access_token = token
-        else:
-            final_app_id, final_app_secret = get_credentials(app_id, app_secret)
-            if not final_app_id or not final_app_secret:
-                console.print("[red]❌ 需要提供凭证[/red]")
-                raise typer.Exit(1)
-            exporter = FeishuExporter(app_id=final_app_id, app_secret=final_app_secret, is_lark=lark)
-            access_token = exporter.get_access_token()
+        exporter, access_token = _build_exporter(token, app_id, app_secret, lark)
 
         # 解析 URL 获取 document_id
         doc_info = exporter.parse_url(url)
@@ -436,7 +564,7 @@ def write(
             user_access_token=access_token,
         )
 
-        console.print(Panel(f"✅ 写入成功! 添加了 {len(blocks)} 个 Block", border_style="green"))
+        console.print(_panel(f"✅ 写入成功! 添加了 {len(blocks)} 个 Block", border_style="green"))
 
     except Exception as e:
         console.print(f"[red]❌ 写入失败: {e}[/red]")
@@ -451,16 +579,10 @@ def update(
         url: str = typer.Argument(..., help="飞书文档 URL"),
         block_id: str = typer.Option(..., "-b", "--block-id", help="Block ID (从 --with-block-ids 导出获取)"),
         content: str = typer.Option(..., "-c", "--content", help="新的文本内容"),
-        token: Optional[str] = typer.Option(
-            None,
-            "-t",
-            "--token",
-            envvar="FEISHU_ACCESS_TOKEN",
-            help="用户访问凭证",
-        ),
-        app_id: Optional[str] = typer.Option(None, "--app-id", help="飞书应用 App ID"),
-        app_secret: Optional[str] = typer.Option(None, "--app-secret", help="飞书应用 App Secret"),
-        lark: bool = typer.Option(False, "--lark", help="使用 Lark (海外版)"),
+        token: Optional[str] = TOKEN_OPTION,
+        app_id: Optional[str] = APP_ID_OPTION,
+        app_secret: Optional[str] = APP_SECRET_OPTION,
+        lark: bool = LARK_OPTION,
 ):
     """
     [green]▶[/] 更新飞书文档中指定 Block 的内容
@@ -475,19 +597,9 @@ def update(
     """
     try:
         from feishu_docx.core.writer import FeishuWriter
-        from feishu_docx import FeishuExporter
 
         # 获取凭证
-        if token:
-            exporter = FeishuExporter.from_token(token)
-            access_token = token
-        else:
-            final_app_id, final_app_secret = get_credentials(app_id, app_secret)
-            if not final_app_id or not final_app_secret:
-                console.print("[red]❌ 需要提供凭证[/red]")
-                raise typer.Exit(1)
-            exporter = FeishuExporter(app_id=final_app_id, app_secret=final_app_secret, is_lark=lark)
-            access_token = exporter.get_access_token()
+        exporter, access_token = _build_exporter(token, app_id, app_secret, lark)
 
         # 解析 URL 获取 document_id
         doc_info = exporter.parse_url(url)
@@ -502,7 +614,7 @@ def update(
             user_access_token=access_token,
         )
 
-        console.print(Panel(f"✅ Block [cyan]{block_id}[/cyan] 更新成功!", border_style="green"))
+        console.print(_panel(f"✅ Block [cyan]{block_id}[/cyan] 更新成功!", border_style="green"))
 
     except Exception as e:
         console.print(f"[red]❌ 更新失败: {e}[/red]")
@@ -516,21 +628,15 @@ def update(
 def export_workspace_schema(
         workspace_id: str = typer.Argument(..., help="工作空间 ID"),
         output: Path = typer.Option(
-            Path("./database_schema.md"),
+            _DEFAULT_SCHEMA_OUTPUT,
             "-o",
             "--output",
             help="输出文件路径",
         ),
-        token: Optional[str] = typer.Option(
-            None,
-            "-t",
-            "--token",
-            envvar="FEISHU_ACCESS_TOKEN",
-            help="用户访问凭证",
-        ),
-        app_id: Optional[str] = typer.Option(None, "--app-id", help="飞书应用 App ID"),
-        app_secret: Optional[str] = typer.Option(None, "--app-secret", help="飞书应用 App Secret"),
-        lark: bool = typer.Option(False, "--lark", help="使用 Lark (海外版)"),
+        token: Optional[str] = TOKEN_OPTION,
+        app_id: Optional[str] = APP_ID_OPTION,
+        app_secret: Optional[str] = APP_SECRET_OPTION,
+        lark: bool = LARK_OPTION,
 ):
     """
     [green]▶[/] 导出数据库结构为 Markdown
@@ -545,16 +651,7 @@ def export_workspace_schema(
     """
     try:
         # 获取凭证
-        if token:
-            exporter = FeishuExporter.from_token(token)
-            access_token = token
-        else:
-            final_app_id, final_app_secret = get_credentials(app_id, app_secret)
-            if not final_app_id or not final_app_secret:
-                console.print("[red]❌ 需要提供凭证[/red]")
-                raise typer.Exit(1)
-            exporter = FeishuExporter(app_id=final_app_id, app_secret=final_app_secret, is_lark=lark)
-            access_token = exporter.get_access_token()
+        exporter, access_token = _build_exporter(token, app_id, app_secret, lark)
 
         console.print(f"[blue]> 工作空间 ID:[/blue] {workspace_id}")
         console.print("[yellow]> 正在获取数据表列表...[/yellow]")
@@ -571,54 +668,41 @@ def export_workspace_schema(
 
         console.print(f"[green]✓ 找到 {len(tables)} 个数据表[/green]")
 
-        # 生成 Markdown
-        markdown_lines = [
-            "# 工作空间数据库结构",
-            "",
-            f"**工作空间 ID**: `{workspace_id}`",
-            f"**数据表数量**: {len(tables)}",
-            "",
-        ]
-
-        for table in tables:
-            table_name = table.get("name", "")
-            description = table.get("description", "")
-            columns = table.get("columns", [])
-
-            markdown_lines.extend([
-                f"## 📋 {table_name}",
-                "",
-            ])
-
-            if description:
-                markdown_lines.extend([f"> {description}", ""])
-
-            markdown_lines.extend([
-                "| 列名 | 类型 | 主键 | 唯一 | 自增 | 数组 | 允许空 | 默认值 | 描述 |",
-                "|------|------|------|------|------|------|--------|--------|------|",
-            ])
-
-            for col in columns:
-                row = (
-                    f"| {col.get('name', '')} "
-                    f"| {col.get('data_type', '')} "
-                    f"| {'✓' if col.get('is_primary_key') else ''} "
-                    f"| {'✓' if col.get('is_unique') else ''} "
-                    f"| {'✓' if col.get('is_auto_increment') else ''} "
-                    f"| {'✓' if col.get('is_array') else ''} "
-                    f"| {'✓' if col.get('is_allow_null') else ''} "
-                    f"| {col.get('default_value', '')} "
-                    f"| {col.get('description', '')} |"
-                )
-                markdown_lines.append(row)
-
-            markdown_lines.append("")
-
-        # 保存文件
+        # 生成 Markdown，逐表直接写入文件
         output.parent.mkdir(parents=True, exist_ok=True)
-        output.write_text("\n".join(markdown_lines), encoding="utf-8")
+        # 写入临时文件后原子替换，导出中断时不会留下半截文件
+        tmp_output = output.with_name(f"{output.name}.tmp")
+        with tmp_output.open("w", encoding="utf-8", buffering=1 << 20) as fp:
+            write = fp.write
+            write(
+                "# 工作空间数据库结构\n\n"
+                f"**工作空间 ID**: `{workspace_id}`\n"
+                f"**数据表数量**: {len(tables)}\n"
+            )
 
-        console.print(Panel(f"✅ 数据库结构已导出: [green]{output}[/green]", border_style="green"))
+            for table in tables:
+                description = table.get("description", "")
+                rows = "".join(
+                    _SCHEMA_ROW_FMT.format(
+                        name, data_type,
+                        _CHECK[bool(pk)], _CHECK[bool(unique)], _CHECK[bool(auto_inc)],
+                        _CHECK[bool(is_array)], _CHECK[bool(allow_null)],
+                        default, desc,
+                    )
+                    for name, data_type, pk, unique, auto_inc, is_array, allow_null, default, desc in (
+                        _SCHEMA_COLUMN_FIELDS({**_SCHEMA_COLUMN_DEFAULTS, **col})
+                        for col in table.get("columns", [])
+                    )
+                )
+                # 每张表只写一次
+                write(_SCHEMA_TABLE_TMPL.format(
+                    name=table.get("name", ""),
+                    desc=_SCHEMA_DESC_TMPL.format(description) if description else "",
+                    rows=rows,
+                ))
+        os.replace(tmp_output, output)
+
+        console.print(_panel(f"✅ 数据库结构已导出: [green]{output}[/green]", border_style="green"))
 
     except Exception as e:
         console.print(f"[red]❌ 导出失败: {e}[/red]")
@@ -632,7 +716,7 @@ def export_workspace_schema(
 def export_wiki_space(
         space_id_or_url: str = typer.Argument(..., help="知识空间 ID、Wiki URL 或 my_library"),
         output: Path = typer.Option(
-            Path("./wiki_export"),
+            _DEFAULT_WIKI_OUTPUT,
             "-o",
             "--output",
             help="输出目录",
@@ -647,16 +731,27 @@ def export_wiki_space(
             "--max-depth",
             help="最大遍历深度",
         ),
-        token: Optional[str] = typer.Option(
-            None,
-            "-t",
-            "--token",
-            envvar="FEISHU_ACCESS_TOKEN",
-            help="用户访问凭证",
+        concurrency: int = typer.Option(
+            8,
+            "-j",
+            "--concurrency",
+            help="并发导出的线程数",
         ),
-        app_id: Optional[str] = typer.Option(None, "--app-id", help="飞书应用 App ID"),
-        app_secret: Optional[str] = typer.Option(None, "--app-secret", help="飞书应用 App Secret"),
-        lark: bool = typer.Option(False, "--lark", help="使用 Lark (海外版)"),
+        force: bool = typer.Option(
+            False,
+            "--force",
+            help="忽略增量缓存，重新导出所有文档",
+        ),
+        verbose: bool = typer.Option(
+            False,
+            "-v",
+            "--verbose",
+            help="逐个输出节点遍历与导出详情（默认仅显示进度条）",
+        ),
+        token: Optional[str] = TOKEN_OPTION,
+        app_id: Optional[str] = APP_ID_OPTION,
+        app_secret: Optional[str] = APP_SECRET_OPTION,
+        lark: bool = LARK_OPTION,
 ):
     """
     [green]▶[/] 批量导出知识空间下的所有文档
@@ -676,19 +771,25 @@ def export_wiki_space(
 
         # 限制遍历深度\\n
         feishu-docx export-wiki-space my_library --max-depth 2
+
+        # 调整并发数\\n
+        feishu-docx export-wiki-space my_library -j 16
+
+        # 忽略增量缓存，全部重新导出\\n
+        feishu-docx export-wiki-space my_library --force
+
+        # 输出每个节点的导出详情\\n
+        feishu-docx export-wiki-space my_library -v
     """
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+
+    from feishu_docx.core.exporter import FeishuExporter
+
     try:
         # 获取凭证
-        if token:
-            exporter = FeishuExporter.from_token(token)
-            access_token = token
-        else:
-            final_app_id, final_app_secret = get_credentials(app_id, app_secret)
-            if not final_app_id or not final_app_secret:
-                console.print("[red]❌ 需要提供凭证[/red]")
-                raise typer.Exit(1)
-            exporter = FeishuExporter(app_id=final_app_id, app_secret=final_app_secret, is_lark=lark)
-            access_token = exporter.get_access_token()
+        exporter, access_token = _build_exporter(token, app_id, app_secret, lark)
 
         # 解析输入参数，支持 URL、space_id 或 my_library
         space_id = space_id_or_url
@@ -732,99 +833,176 @@ def export_wiki_space(
         console.print(f"[blue]> 知识空间 ID:[/blue] {space_id}")
         console.print(f"[blue]> 输出目录:[/blue] {output}")
         console.print(f"[blue]> 最大深度:[/blue] {max_depth}")
+        console.print(f"[blue]> 并发数:[/blue] {concurrency}")
 
         # 创建输出目录
         output.mkdir(parents=True, exist_ok=True)
 
         exported_count = 0
         failed_count = 0
+        skipped_count = 0
+        doc_total = 0
+
+        # 增量缓存：node_token -> {obj_token, edit_time, path}，未变更的文档跳过导出
+        cache_file = output / _EXPORT_CACHE_NAME
+        old_cache = {} if force else _load_export_cache(cache_file)
+        new_cache: dict[str, dict] = dict(old_cache)  # 保留本次未遍历到的节点记录
 
         # 确定域名
         domain = "larksuite.com" if lark else "my.feishu.cn"
 
-        # 递归遍历节点
-        def traverse_nodes(parent_token: Optional[str] = None, depth: int = 0, current_path: Path = output):
-            nonlocal exported_count, failed_count
+        # 每个线程独立的导出器（SDK 的 temp_dir 按导出切换，不能跨线程共享）
+        local = threading.local()
 
-            if depth > max_depth:
-                return
+        def thread_exporter() -> "FeishuExporter":
+            if not hasattr(local, "exporter"):
+                local.exporter = FeishuExporter.from_token(access_token)
+            return local.exporter
 
-            console.print(f"[yellow]> 正在遍历第 {depth} 层: {current_path.name}...[/yellow]")
-
-            # 获取子节点列表
-            nodes = exporter.sdk.get_all_wiki_space_nodes(
+        def list_nodes(parent_token: Optional[str], depth: int, current_path: Path) -> list:
+            if verbose:
+                console.print(f"[yellow]> 正在遍历第 {depth} 层: {current_path.name}...[/yellow]")
+            return thread_exporter().sdk.get_all_wiki_space_nodes(
                 space_id=space_id,
                 user_access_token=access_token,
                 parent_node_token=parent_token,
             )
 
-            if not nodes:
-                return
+        def export_node(url: str, output_dir: Path, filename: str) -> Path:
+            return thread_exporter().export(
+                url=url,
+                output_dir=output_dir,
+                filename=filename,
+                silent=True,
+            )
 
-            for node in nodes:
+        # 主线程调度：节点列表与文档导出都提交到线程池，计数只在主线程更新
+        with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(bar_width=20),
+                MofNCompleteColumn(),
+                console=console,
+                transient=True,
+        ) as progress, ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            task_id = progress.add_task("[cyan]导出文档...[/cyan]", total=0)
+            # future -> ("list", (depth, 相对路径), 目录) 或 ("export", 成功提示, (文档名, node_token, 缓存记录))
+            pending = {}
+
+            def submit_export(node: dict, url: str, target_dir: Path, safe_title: str, label: str):
+                nonlocal skipped_count, doc_total
+                doc_total += 1
+                progress.update(task_id, total=doc_total)
                 node_token = node.get("node_token")
-                obj_type = node.get("obj_type")
-                obj_token = node.get("obj_token")
-                title = node.get("title", "untitled")
-                has_child = node.get("has_child", False)
-
-                # 清理文件名中的非法字符
-                safe_title = title.replace("/", "_").replace("\\", "_")
-
-                # 判断是否为文档类型
-                if obj_type in ["doc", "docx", "sheet", "bitable"]:
-                    try:
-                        # 构建文档 URL
-                        url = f"https://{domain}/{obj_type}/{obj_token}"
-
-                        # 如果有子节点，创建子目录并导出
-                        if has_child:
-                            # 创建以文档名命名的子目录
-                            doc_dir = current_path / safe_title
-                            doc_dir.mkdir(parents=True, exist_ok=True)
-
-                            # 导出文档到子目录
-                            file_path = exporter.export(
-                                url=url,
-                                output_dir=doc_dir,
-                                filename=safe_title,
-                                silent=True,
-                            )
-                            exported_count += 1
-                            console.print(f"[green]✓ 已导出:[/green] {safe_title} → {doc_dir.relative_to(output)}")
-
-                            # 递归处理子节点
-                            traverse_nodes(node_token, depth + 1, doc_dir)
-                        else:
-                            # 无子节点，直接导出到当前目录
-                            file_path = exporter.export(
-                                url=url,
-                                output_dir=current_path,
-                                filename=safe_title,
-                                silent=True,
-                            )
+                record = {
+                    "obj_token": node.get("obj_token"),
+                    "edit_time": node.get("obj_edit_time"),
+                }
+                # 编辑时间未变化、目标路径未变（未重命名/移动）且上次导出的文件仍在，直接复用上次导出结果
+                old_record = old_cache.get(node_token) or {}
+                if (
+                        record["edit_time"]
+                        and old_record.get("obj_token") == record["obj_token"]
+                        and old_record.get("edit_time") == record["edit_time"]
+                        and old_record.get("path") == os.path.relpath(target_dir / f"{safe_title}.md", output)
+                        and (output / old_record["path"]).exists()
+                ):
+                    new_cache[node_token] = old_record
+                    skipped_count += 1
+                    progress.advance(task_id)
+                    if verbose:
+                        console.print(f"[dim]↷ 未变更，跳过: {safe_title}[/dim]")
+                    return
+                future = pool.submit(export_node, url, target_dir, safe_title)
+                pending[future] = ("export", label, (safe_title, node_token, record))
+
+            def submit_children(node_token: Optional[str], depth: int, current_path: Path, rel: str):
+                if depth <= max_depth:
+                    future = pool.submit(list_nodes, node_token, depth, current_path)
+                    pending[future] = ("list", (depth, rel), current_path)
+
+            # 开始遍历
+            submit_children(parent_node, 0, output, "")
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, info, target = pending.pop(future)
+
+                    # 文档导出结果
+                    if kind == "export":
+                        safe_title, node_token, record = target
+                        progress.advance(task_id)
+                        try:
+                            # 记录 export() 实际写入的路径，而非按标题推算
+                            record["path"] = os.path.relpath(future.result(), output)
                             exported_count += 1
-                            console.print(f"[green]✓ 已导出:[/green] {safe_title}")
+                            new_cache[node_token] = record
+                            if verbose:
+                                console.print(f"[green]✓ 已导出:[/green] {info}")
+                        except Exception as e:
+                            failed_count += 1
+                            console.print(f"[red]✗ 导出失败:[/red] {safe_title} - {e}")
+                        continue
+
+                    # 节点列表结果
+                    (depth, rel), current_path = info, target
+                    try:
+                        nodes = future.result() or []
                     except Exception as e:
                         failed_count += 1
-                        console.print(f"[red]✗ 导出失败:[/red] {safe_title} - {e}")
-                else:
-                    # 非文档类型（如文件夹），只递归处理子节点
-                    if has_child:
-                        # 为文件夹创建子目录
-                        folder_dir = current_path / safe_title
-                        folder_dir.mkdir(parents=True, exist_ok=True)
-                        console.print(f"[cyan]📁 文件夹:[/cyan] {safe_title}")
-                        traverse_nodes(node_token, depth + 1, folder_dir)
-
-        # 开始遍历
-        traverse_nodes(parent_node)
+                        console.print(f"[red]✗ 遍历失败:[/red] {current_path.name} - {e}")
+                        continue
+
+                    used_names: set[str] = set()
+                    for node in nodes:
+                        node_token = node.get("node_token")
+                        obj_type = node.get("obj_type")
+                        obj_token = node.get("obj_token")
+                        title = node.get("title", "untitled")
+                        has_child = node.get("has_child", False)
+
+                        # 既非文档也无子节点，无需导出
+                        if obj_type not in _WIKI_DOC_TYPES and not has_child:
+                            continue
+
+                        # 清理文件名中的非法字符，同级重名追加序号
+                        safe_title = _unique_name(title.translate(_SAFE_TITLE_TABLE) or "untitled", used_names)
+
+                        # 判断是否为文档类型
+                        if obj_type in _WIKI_DOC_TYPES:
+                            # 构建文档 URL
+                            url = f"https://{domain}/{obj_type}/{obj_token}"
+
+                            if has_child:
+                                # 有子节点：创建以文档名命名的子目录，导出到子目录并遍历子节点
+                                doc_dir = current_path / safe_title
+                                doc_dir.mkdir(parents=True, exist_ok=True)
+                                # 相对路径随遍历拼接，无需 relative_to
+                                doc_rel = os.path.join(rel, safe_title) if rel else safe_title
+                                submit_export(node, url, doc_dir, safe_title, f"{safe_title} → {doc_rel}")
+                                submit_children(node_token, depth + 1, doc_dir, doc_rel)
+                            else:
+                                # 无子节点，直接导出到当前目录
+                                submit_export(node, url, current_path, safe_title, safe_title)
+                        else:
+                            # 非文档类型（如文件夹），只递归处理子节点
+                            folder_dir = current_path / safe_title
+                            folder_dir.mkdir(parents=True, exist_ok=True)
+                            if verbose:
+                                console.print(f"[cyan]📁 文件夹:[/cyan] {safe_title}")
+                            folder_rel = os.path.join(rel, safe_title) if rel else safe_title
+                            submit_children(node_token, depth + 1, folder_dir, folder_rel)
+
+        # 保存增量缓存
+        _save_export_cache(cache_file, new_cache)
 
         # 输出统计
-        console.print(Panel(
+        console.print(_panel(
             f"✅ 导出完成!\n\n"
             f"[green]成功:[/green] {exported_count} 个文档\n"
             f"[red]失败:[/red] {failed_count} 个文档\n"
+            f"[dim]跳过:[/dim] {skipped_count} 个未变更文档\n"
             f"[blue]输出目录:[/blue] {output}",
             border_style="green",
         ))
@@ -868,6 +1046,8 @@ def auth(
 
     授权成功后，Token 将被缓存，后续导出无需再次授权。
     """
+    from feishu_docx.auth.oauth import OAuth2Authenticator
+
     try:
         # 获取凭证
         final_app_id, final_app_secret = get_credentials(app_id, app_secret)
@@ -891,7 +1071,7 @@ def auth(
         console.print("[yellow]>[/yellow] 正在进行 OAuth 授权...")
         token = authenticator.authenticate()
 
-        console.print(Panel(
+        console.print(_panel(
             f"✅ 授权成功！\n\n"
             f"Token 已缓存至: [cyan]{authenticator.cache_file}[/cyan]\n\n"
             f"后续使用 [green]feishu-docx export[/green] 命令将自动使用缓存的 Token。",
@@ -927,6 +1107,10 @@ def tui():
 # ==============================================================================
 # config 命令组
 # ==============================================================================
+# config show 显示用标记
+_MASKED = "[dim]已设置（已隐藏）[/dim]"
+_UNSET = "[dim]未设置[/dim]"
+
 config_app = typer.Typer(help="[dim]❄[/] 配置管理", rich_markup_mode="rich")
 app.add_typer(config_app, name="config")
 
@@ -957,6 +1141,8 @@ def config_set(
     示例:
         feishu-docx config set --app-id cli_xxx --app-secret xxx
     """
+    from feishu_docx.utils.config import AppConfig
+
     config = AppConfig.load()
 
     # 更新配置（只更新传入的值）
@@ -975,7 +1161,7 @@ def config_set(
 
     config.save()
 
-    console.print(Panel(
+    console.print(_panel(
         f"✅ 配置已保存至: [cyan]{config.config_file}[/cyan]\n\n"
         f"App ID: [green]{config.app_id[:10]}...{config.app_id[-4:]}[/green]\n"
         f"App Secret: [dim]已保存（已隐藏）[/dim]\n"
@@ -991,53 +1177,76 @@ def config_set(
 @config_app.command("show")
 def config_show():
     """显示当前配置"""
-    config = AppConfig.load()
+    from feishu_docx.utils.config import AppConfig, get_config_dir
 
-    table = Table(title="当前配置")
-    table.add_column("配置项", style="cyan")
-    table.add_column("来源", style="dim")
-    table.add_column("值", style="green")
+    config = AppConfig.load_cached()
+    env = _env()
+    rows: list[tuple[str, str, str]] = []
 
     # App ID
-    app_id_env = os.getenv("FEISHU_APP_ID")
+    app_id_env = env["FEISHU_APP_ID"]
     if app_id_env:
-        table.add_row("App ID", "环境变量",
-                      f"{app_id_env[:10]}...{app_id_env[-4:]}" if len(app_id_env) > 14 else app_id_env)
+        rows.append(("App ID", "环境变量", _mask(app_id_env)))
     elif config.app_id:
-        table.add_row("App ID", "配置文件",
-                      f"{config.app_id[:10]}...{config.app_id[-4:]}" if len(config.app_id) > 14 else config.app_id)
+        rows.append(("App ID", "配置文件", _mask(config.app_id)))
     else:
-        table.add_row("App ID", "-", "[dim]未设置[/dim]")
+        rows.append(("App ID", "-", _UNSET))
 
     # App Secret
-    app_secret_env = os.getenv("FEISHU_APP_SECRET")
+    app_secret_env = env["FEISHU_APP_SECRET"]
     if app_secret_env:
-        table.add_row("App Secret", "环境变量", "[dim]已设置（已隐藏）[/dim]")
+        rows.append(("App Secret", "环境变量", _MASKED))
     elif config.app_secret:
-        table.add_row("App Secret", "配置文件", "[dim]已设置（已隐藏）[/dim]")
+        rows.append(("App Secret", "配置文件", _MASKED))
     else:
-        table.add_row("App Secret", "-", "[dim]未设置[/dim]")
+        rows.append(("App Secret", "-", _UNSET))
 
     # Access Token
-    if os.getenv("FEISHU_ACCESS_TOKEN"):
-        table.add_row("Access Token", "环境变量", "[dim]已设置（已隐藏）[/dim]")
-    else:
-        if not (app_secret_env or config.app_secret) and not (app_id_env or config.app_id):
-            table.add_row("Access Token", "-", "[dim]未设置[/dim]")
+    if env["FEISHU_ACCESS_TOKEN"]:
+        rows.append(("Access Token", "环境变量", _MASKED))
+    elif not (app_secret_env or config.app_secret) and not (app_id_env or config.app_id):
+        rows.append(("Access Token", "-", _UNSET))
 
     # Lark 模式
-    table.add_row("Lark 模式", "配置文件", "是" if config.is_lark else "否")
+    rows.append(("Lark 模式", "配置文件", "是" if config.is_lark else "否"))
 
     # 缓存位置
     cache_dir = get_config_dir()
-    table.add_row("配置文件", "-", "存在" if config.config_file.exists() else "❌ 不存在")
-    table.add_row("Token 缓存", "-", "存在" if (cache_dir / "token.json").exists() else "❌ 不存在")
-    table.add_row("配置目录", "-", str(cache_dir))
+    # 配置文件与 Token 缓存同在配置目录，一次 scandir 代替逐个 stat
+    try:
+        with os.scandir(cache_dir) as it:
+            names = {entry.name for entry in it}
+    except OSError:
+        names = set()
+    rows.append(("配置文件", "-", "存在" if config.config_file.name in names else "❌ 不存在"))
+    rows.append(("Token 缓存", "-", "存在" if "token.json" in names else "❌ 不存在"))
+    rows.append(("配置目录", "-", str(cache_dir)))
+    show_hint = not config.has_credentials() and not app_id_env
+
+    # 输出被重定向（非终端）时直接输出纯文本，跳过 Rich 表格排版
+    if not console.is_terminal:
+        from rich.markup import render
+
+        sys.stdout.write("".join(
+            f"{name}\t{source}\t{render(value).plain}\n" for name, source, value in rows
+        ))
+        if show_hint:
+            sys.stdout.write("\n提示: 运行 feishu-docx config set --app-id xxx --app-secret xxx 配置凭证\n")
+        return
+
+    from rich.table import Table
+
+    table = Table(title="当前配置")
+    table.add_column("配置项", style="cyan")
+    table.add_column("来源", style="dim")
+    table.add_column("值", style="green")
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
     # 提示
-    if not config.has_credentials() and not app_id_env:
+    if show_hint:
         console.print("\n[yellow]💡 提示: 运行以下命令配置凭证[/yellow]")
         console.print("   [cyan]feishu-docx config set --app-id xxx --app-secret xxx[/cyan]")
 
@@ -1050,6 +1259,8 @@ def config_clear(
         all: bool = typer.Option(False, "--all", "-a", help="同时清除配置和 Token 缓存"),
 ):
     """清除配置和缓存"""
+    from feishu_docx.utils.config import AppConfig, get_config_dir
+
     app_config = AppConfig.load()
     cache_dir = get_config_dir()
     token_file = cache_dir / "token.json"
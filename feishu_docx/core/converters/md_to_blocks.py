@@ -2,13 +2,54 @@
 # -*- coding: utf-8 -*-
 # =====================================================
 # @File   ：md_to_blocks.py
-# @Date   ：2026/01/28 12:40
+# @Date   ：2026/10/16 10:00
 # @Author ：leemysw
 # 2026/01/18 15:40   Create
 # 2026/01/28 10:20   Add image/table/math support
 # 2026/01/28 12:20   Fix equation block schema and Å mapping
 # 2026/01/28 12:30   Fix \\text{..._...} subscript rendering
 # 2026/01/28 12:40   Fix mistune table parsing and cell content
+# 2026/10/16 10:00   Performance: table-driven dispatch and filtering
+# 2026/10/16 10:00   Iterative inline text extraction
+# 2026/10/16 10:00   Intern text_element_style dicts
+# 2026/10/16 10:00   Share one mistune parser per class
+# 2026/10/16 10:00   Extract paragraph inline runs in one pass
+# 2026/10/16 10:00   Shared empty sentinels for token lookups
+# 2026/10/16 10:00   Add convert_iter generator
+# 2026/10/16 10:00   Precomputed heading payload keys
+# 2026/10/16 10:00   Skip newline replacement for single-line text
+# 2026/10/16 10:00   Builders skip empty blocks; drop post-filter
+# 2026/10/16 10:00   Bind hot-loop methods to locals
+# 2026/10/16 10:00   Code language aliases
+# 2026/10/16 10:00   Flatten list/quote inline children with chain
+# 2026/10/16 10:00   Add __slots__
+# 2026/10/16 10:00   Module-level block type constants
+# 2026/10/16 10:00   Cache parsed token lists by content hash
+# 2026/10/16 10:00   Precompile LaTeX sanitize regexes
+# 2026/10/16 10:00   Newline scrubbing via str.translate
+# 2026/10/16 10:00   Hoist per-child lookups in text extraction
+# 2026/10/16 10:00   Build long-text chunks with one comprehension
+# 2026/10/16 10:00   Prefix check for remote image URLs
+# 2026/10/16 10:00   Table cells via comprehension + placeholder factory
+# 2026/10/16 10:00   Plain-text paragraph fast path
+# 2026/10/16 10:00   convert_file: binary read + single decode
+# 2026/10/16 10:00   Add convert_many batch API
+# 2026/10/16 10:00   Precomputed heading block types
+# 2026/10/16 10:00   Shared empty text_element_style
+# 2026/10/16 10:00   Single-pass LaTeX sanitize
+# 2026/10/16 10:00   Skip LaTeX sanitize when no backslash
+# 2026/10/16 10:00   Paragraph/list builders yield blocks
+# 2026/10/16 10:00   Table cell fast path without images
+# 2026/10/16 10:00   Pad table rows with chain/repeat
+# 2026/10/16 10:00   Table-driven inline style flags
+# 2026/10/16 10:00   LRU cache for LaTeX sanitize
+# 2026/10/16 10:00   Share empty image/divider payloads
+# 2026/10/16 10:00   Unbuffered readall in convert_file
+# 2026/10/16 10:00   Remove parse cache
+# 2026/10/16 10:00   convert_many: staticmethod, chunksize from file count
+# 2026/10/16 10:00   Dispatch tokens by builder method name
+# 2026/10/16 10:00   Fresh text_element_style per text node
+# 2026/10/16 10:00   Fresh image/divider payload per block
 # =====================================================
 """
 Markdown → 飞书 Block 转换器
@@ -19,13 +60,163 @@ Markdown → 飞书 Block 转换器
 [PROTOCOL]: 变更时更新此头部，然后检查 CLAUDE.md
 """
 
+import os
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, repeat
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import mistune
 from mistune.plugins.math import math as math_plugin
 from mistune.plugins.table import table as table_plugin
 
+# 共享空容器（只读约定，避免 .get(key, {}) / .get(key, []) 每次分配新对象）
+_EMPTY_DICT: Dict[str, Any] = {}
+_EMPTY_LIST: List[Any] = []
+
+# LaTeX 清洗正则（预编译，避免每个公式重复查 re 缓存）
+_RE_OPERATORNAME = re.compile(r"\\operatorname\s*{([^}]*)}")
+_RE_TAG = re.compile(r"\\tag\s*{([^}]*)}")
+_RE_TEXT = re.compile(r"\\text\s*{([^}]*)}")
+_RE_MATHRING_MATHRM_A = re.compile(r"\\mathring\s*{\s*\\mathrm\s*(?:{\s*A\s*}|A)\s*}")
+_RE_MATHRING_A = re.compile(r"\\mathring\s*{\s*A\s*}")
+_RE_MATHRING = re.compile(r"\\mathring\s*{([^}]*)}")
+
+
+def _text_to_mathrm(m: "re.Match[str]") -> str:
+    """\\text{...} 内含下标/上标时改用 \\mathrm，否则保持原样"""
+    inner = m.group(1)
+    return f"\\mathrm{{{inner}}}" if ("_" in inner or "^" in inner) else m.group(0)
+
+
+def _sanitize_latex_sequential(content: str) -> str:
+    """逐条正则替换（替换顺序即语义，嵌套命令时使用）"""
+    content = _RE_OPERATORNAME.sub(r"\\text{\1}", content)
+    content = _RE_TAG.sub(r"(\1)", content)
+    content = _RE_TEXT.sub(_text_to_mathrm, content)
+    content = _RE_MATHRING_MATHRM_A.sub(r"\\AA", content)
+    content = _RE_MATHRING_A.sub(r"\\AA", content)
+    content = _RE_MATHRING.sub(r"\1", content)
+    return content
+
+
+# 上述六条规则合并为一条交替正则，分支顺序与逐条替换的顺序一致
+_RE_LATEX_ALL = re.compile(
+    r"\\operatorname\s*{(?P<op>[^}]*)}"
+    r"|\\tag\s*{(?P<tag>[^}]*)}"
+    r"|\\text\s*{(?P<txt>[^}]*)}"
+    r"|(?P<aa>\\mathring\s*{\s*\\mathrm\s*(?:{\s*A\s*}|A)\s*}|\\mathring\s*{\s*A\s*})"
+    r"|\\mathring\s*{(?P<mr>[^}]*)}"
+)
+
+
+class _NestedLatex(Exception):
+    """命令参数内含反斜杠（嵌套命令），单次扫描无法复现逐条替换的结果"""
+
+
+def _latex_dispatch(m: "re.Match[str]") -> str:
+    """_RE_LATEX_ALL 的替换回调"""
+    kind = m.lastgroup
+    if kind == "aa":
+        return "\\AA"
+    inner = m.group(kind)
+    if "\\" in inner:
+        raise _NestedLatex
+    if kind == "op":
+        # \operatorname{x} -> \text{x}，随后同样适用 \text 的下标/上标规则
+        return f"\\mathrm{{{inner}}}" if ("_" in inner or "^" in inner) else f"\\text{{{inner}}}"
+    if kind == "tag":
+        return f"({inner})"
+    if kind == "txt":
+        return f"\\mathrm{{{inner}}}" if ("_" in inner or "^" in inner) else m.group(0)
+    return inner
+
+
+@lru_cache(maxsize=1024)
+def _sanitize_latex_cached(content: str) -> str:
+    """LaTeX 清洗（纯函数，按内容缓存；文档中常有重复公式）"""
+    try:
+        # 单次扫描完成全部替换
+        return _RE_LATEX_ALL.sub(_latex_dispatch, content)
+    except _NestedLatex:
+        # 命令参数中嵌套了其他命令，按原顺序逐条替换以保持结果一致
+        return _sanitize_latex_sequential(content)
+
+
+# 换行 -> 空格（单次 C 层查表替换）
+_NEWLINE_TABLE = str.maketrans("\r\n", "  ")
+
+# 单个 text_run 的最大字符数
+_TEXT_RUN_LIMIT = 2000
+
+# 远程图片 URL 前缀（与 ^(?:https?:)?//|^data: 等价，忽略大小写）
+_REMOTE_PREFIXES = ("http://", "https://", "//", "data:")
+
+# 行内样式节点类型 -> text_element_style 键
+_INLINE_STYLE_FLAGS = {
+    "strong": "bold",
+    "emphasis": "italic",
+    "strikethrough": "strikethrough",
+}
+
+# Block 类型（模块级常量，builder 中按全局名访问，比 self 属性查找更快）
+BLOCK_TYPE_TEXT = 2
+BLOCK_TYPE_HEADING1 = 3
+BLOCK_TYPE_HEADING2 = 4
+BLOCK_TYPE_HEADING3 = 5
+BLOCK_TYPE_HEADING4 = 6
+BLOCK_TYPE_HEADING5 = 7
+BLOCK_TYPE_HEADING6 = 8
+BLOCK_TYPE_HEADING7 = 9
+BLOCK_TYPE_HEADING8 = 10
+BLOCK_TYPE_HEADING9 = 11
+BLOCK_TYPE_BULLET = 12
+BLOCK_TYPE_ORDERED = 13
+BLOCK_TYPE_CODE = 14
+BLOCK_TYPE_QUOTE = 15
+BLOCK_TYPE_TODO = 17
+BLOCK_TYPE_DIVIDER = 22
+BLOCK_TYPE_IMAGE = 27
+BLOCK_TYPE_TABLE = 31
+BLOCK_TYPE_TABLE_CELL = 32
+
+
+def _canon_style(items: Tuple[Tuple[str, Any], ...]) -> Dict[str, Any]:
+    """样式键 -> text_element_style（每次新建 dict，返回给调用方的 Block 互不共享可变对象）"""
+    return {k: ({"url": v} if k == "link" else v) for k, v in items}
+
+
+def _with_style(items: Tuple[Tuple[str, Any], ...], key: str, value: Any) -> Tuple[Tuple[str, Any], ...]:
+    """在样式键中设置 key（已存在则原位替换，与 dict 赋值顺序一致）"""
+    for i, (k, _) in enumerate(items):
+        if k == key:
+            return items[:i] + ((key, value),) + items[i + 1:]
+    return items + ((key, value),)
+
+
+def _text_runs(text_content: str, style: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """文本 -> text_run 元素列表（换行替换为空格，超长文本按 _TEXT_RUN_LIMIT 切片）"""
+    # 绝大多数行内文本不含换行，先判断再替换，避免无谓的字符串复制
+    if "\r" in text_content:
+        # \r\n 先归一为单个换行，保证替换后仍是一个空格
+        text_content = text_content.replace("\r\n", "\n").translate(_NEWLINE_TABLE)
+    elif "\n" in text_content:
+        text_content = text_content.translate(_NEWLINE_TABLE)
+
+    if len(text_content) > _TEXT_RUN_LIMIT:
+        # 超长文本按上限切片，所有分片共享同一样式 dict
+        return [
+            {"text_run": {"content": text_content[i:i + _TEXT_RUN_LIMIT], "text_element_style": style}}
+            for i in range(0, len(text_content), _TEXT_RUN_LIMIT)
+        ]
+    return [{"text_run": {"content": text_content, "text_element_style": style}}]
+
+
+def _empty_text_block() -> Dict[str, Any]:
+    """空文本 Block（表格空单元格占位；写入时会被修改，每次返回新对象）"""
+    return {"block_type": BLOCK_TYPE_TEXT, "text": {"elements": []}}
+
 
 class MarkdownToBlocks:
     """
@@ -35,26 +226,40 @@ class MarkdownToBlocks:
     支持：标题、段落、列表、代码块、引用、分割线、文本样式。
     """
 
-    # Block 类型映射
-    BLOCK_TYPE_TEXT = 2
-    BLOCK_TYPE_HEADING1 = 3
-    BLOCK_TYPE_HEADING2 = 4
-    BLOCK_TYPE_HEADING3 = 5
-    BLOCK_TYPE_HEADING4 = 6
-    BLOCK_TYPE_HEADING5 = 7
-    BLOCK_TYPE_HEADING6 = 8
-    BLOCK_TYPE_HEADING7 = 9
-    BLOCK_TYPE_HEADING8 = 10
-    BLOCK_TYPE_HEADING9 = 11
-    BLOCK_TYPE_BULLET = 12
-    BLOCK_TYPE_ORDERED = 13
-    BLOCK_TYPE_CODE = 14
-    BLOCK_TYPE_QUOTE = 15
-    BLOCK_TYPE_TODO = 17
-    BLOCK_TYPE_DIVIDER = 22
-    BLOCK_TYPE_IMAGE = 27
-    BLOCK_TYPE_TABLE = 31
-    BLOCK_TYPE_TABLE_CELL = 32
+    # 实例仅持有图片路径（解析器为类级别共享）
+    __slots__ = ("image_paths",)
+
+    # Block 类型映射（类属性保持对外兼容，取值同模块级常量）
+    BLOCK_TYPE_TEXT = BLOCK_TYPE_TEXT
+    BLOCK_TYPE_HEADING1 = BLOCK_TYPE_HEADING1
+    BLOCK_TYPE_HEADING2 = BLOCK_TYPE_HEADING2
+    BLOCK_TYPE_HEADING3 = BLOCK_TYPE_HEADING3
+    BLOCK_TYPE_HEADING4 = BLOCK_TYPE_HEADING4
+    BLOCK_TYPE_HEADING5 = BLOCK_TYPE_HEADING5
+    BLOCK_TYPE_HEADING6 = BLOCK_TYPE_HEADING6
+    BLOCK_TYPE_HEADING7 = BLOCK_TYPE_HEADING7
+    BLOCK_TYPE_HEADING8 = BLOCK_TYPE_HEADING8
+    BLOCK_TYPE_HEADING9 = BLOCK_TYPE_HEADING9
+    BLOCK_TYPE_BULLET = BLOCK_TYPE_BULLET
+    BLOCK_TYPE_ORDERED = BLOCK_TYPE_ORDERED
+    BLOCK_TYPE_CODE = BLOCK_TYPE_CODE
+    BLOCK_TYPE_QUOTE = BLOCK_TYPE_QUOTE
+    BLOCK_TYPE_TODO = BLOCK_TYPE_TODO
+    BLOCK_TYPE_DIVIDER = BLOCK_TYPE_DIVIDER
+    BLOCK_TYPE_IMAGE = BLOCK_TYPE_IMAGE
+    BLOCK_TYPE_TABLE = BLOCK_TYPE_TABLE
+    BLOCK_TYPE_TABLE_CELL = BLOCK_TYPE_TABLE_CELL
+
+    # 标题层级 -> Block 类型 / payload 键（按 level - 1 索引，level 1-6）
+    _HEADING_BLOCK_TYPES = (
+        BLOCK_TYPE_HEADING1,
+        BLOCK_TYPE_HEADING2,
+        BLOCK_TYPE_HEADING3,
+        BLOCK_TYPE_HEADING4,
+        BLOCK_TYPE_HEADING5,
+        BLOCK_TYPE_HEADING6,
+    )
+    _HEADING_KEYS = ("heading1", "heading2", "heading3", "heading4", "heading5", "heading6")
 
     # 代码语言映射
     LANGUAGE_MAP = {
@@ -82,14 +287,38 @@ class MarkdownToBlocks:
         "markdown": 34,
     }
 
+    # 语言查找表：LANGUAGE_MAP + 常见别名
+    _LANG_ALIASES = {
+        **LANGUAGE_MAP,
+        "py": 49,
+        "js": 22,
+        "ts": 75,
+        "c++": 7,
+        "c#": 8,
+        "rb": 55,
+        "sh": 61,
+        "zsh": 61,
+        "yml": 81,
+        "md": 34,
+    }
+
+    # mistune 解析器（类级别共享，首次使用时创建）
+    _md_parser: Optional[mistune.Markdown] = None
+
     def __init__(self):
         """初始化转换器"""
-        self._md = mistune.create_markdown(
-            renderer=None,
-            plugins=[table_plugin, math_plugin],
-        )
         self.image_paths: List[str] = []
 
+    @classmethod
+    def _get_parser(cls) -> mistune.Markdown:
+        """获取共享的 mistune 解析器（解析状态按次创建，解析器本身可复用）"""
+        if cls._md_parser is None:
+            cls._md_parser = mistune.create_markdown(
+                renderer=None,
+                plugins=[table_plugin, math_plugin],
+            )
+        return cls._md_parser
+
     def convert(self, markdown_text: str) -> Tuple[List[Dict[str, Any]], List[str]]:
         """
         将 Markdown 文本转换为飞书 Block 列表
@@ -100,44 +329,37 @@ class MarkdownToBlocks:
         Returns:
             (Blocks 列表, 图片路径列表)
         """
+        blocks = list(self.convert_iter(markdown_text))
+        return blocks, self.image_paths
+
+    def convert_iter(self, markdown_text: str) -> Iterator[Dict[str, Any]]:
+        """
+        将 Markdown 文本逐个转换为飞书 Block（生成器）
+
+        图片路径在迭代过程中收集到 self.image_paths，迭代结束后完整。
+
+        Args:
+            markdown_text: Markdown 文本
+
+        Yields:
+            飞书 Block
+        """
         self.image_paths = []
-        tokens = self._md.parse(markdown_text)
+        tokens = self._get_parser().parse(markdown_text)
         if isinstance(tokens, tuple):
             tokens = tokens[0]
 
-        blocks = []
+        # 各 builder 不产出空内容的文本类 Block，这里无需再过滤
+        convert_token = self._convert_token  # 热循环内绑定为局部变量
         for token in tokens:
-            block = self._convert_token(token)
+            block = convert_token(token)
             if not block:
                 continue
-
-            new_blocks = block if isinstance(block, list) else [block]
-            for b in new_blocks:
-                if not isinstance(b, dict):
-                    continue
-                bt = b.get("block_type")
-                if bt in [
-                    self.BLOCK_TYPE_TEXT,
-                    self.BLOCK_TYPE_HEADING1,
-                    self.BLOCK_TYPE_HEADING2,
-                    self.BLOCK_TYPE_HEADING3,
-                    self.BLOCK_TYPE_HEADING4,
-                    self.BLOCK_TYPE_HEADING5,
-                    self.BLOCK_TYPE_HEADING6,
-                    self.BLOCK_TYPE_HEADING7,
-                    self.BLOCK_TYPE_HEADING8,
-                    self.BLOCK_TYPE_HEADING9,
-                    self.BLOCK_TYPE_BULLET,
-                    self.BLOCK_TYPE_ORDERED,
-                    self.BLOCK_TYPE_QUOTE,
-                    self.BLOCK_TYPE_TODO,
-                ]:
-                    payload_key = next((k for k in b.keys() if k != "block_type"), None)
-                    if payload_key and not b[payload_key].get("elements"):
-                        continue
-                blocks.append(b)
-
-        return blocks, self.image_paths
+            # 单个 Block 为 dict；段落/列表返回生成器，直接串联输出
+            if isinstance(block, dict):
+                yield block
+            else:
+                yield from block
 
     def convert_file(self, file_path: str) -> Tuple[List[Dict[str, Any]], List[str]]:
         """
@@ -149,93 +371,115 @@ class MarkdownToBlocks:
         Returns:
             (Blocks 列表, 图片路径列表)
         """
-        with open(file_path, "r", encoding="utf-8") as f:
-            return self.convert(f.read())
+        # 二进制读取后一次性解码，省去文本模式的分块解码与换行转换（mistune 解析时会统一换行符）
+        # 无缓冲 FileIO.readall 按 st_size 预分配，一次系统调用读完，避免经过 BufferedReader 额外拷贝
+        with open(file_path, "rb", buffering=0) as f:
+            content = f.readall().decode("utf-8")
+        return self.convert(content)
+
+    @staticmethod
+    def convert_many(
+            file_paths: List[str],
+            workers: Optional[int] = None,
+    ) -> List[Tuple[List[Dict[str, Any]], List[str]]]:
+        """
+        批量转换多个 Markdown 文件（多进程并行）
+
+        Args:
+            file_paths: 文件路径列表
+            workers: 进程数，默认 CPU 核数
+
+        Returns:
+            与 file_paths 顺序一致的 (Blocks 列表, 图片路径列表) 列表
+        """
+        if len(file_paths) <= 1:
+            # 单个文件无需启动进程池
+            return [_convert_file_worker(path) for path in file_paths]
+
+        workers = min(workers or os.cpu_count() or 1, len(file_paths))
+        # 每个进程约分到 4 批，兼顾 IPC 开销与负载均衡
+        chunksize = max(1, len(file_paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_convert_file_worker, file_paths, chunksize=chunksize))
 
     @staticmethod
     def _is_remote_url(url: str) -> bool:
         """判断是否为远程 URL（不可直接上传）"""
-        return bool(re.match(r"^(?:https?:)?//|^data:", url.strip(), re.IGNORECASE))
-
-    def _convert_token(self, token: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """转换单个 token"""
-        token_type = token.get("type")
-
-        if token_type == "heading":
-            return self._make_heading(token)
-        elif token_type == "paragraph":
-            return self._make_paragraph(token)
-        elif token_type == "list":
-            return self._make_list(token)
-        elif token_type == "block_code":
-            return self._make_code_block(token)
-        elif token_type == "block_quote":
-            return self._make_quote(token)
-        elif token_type == "thematic_break":
-            return self._make_divider()
-        elif token_type == "block_math":
-            return self._make_equation(token)
-        elif token_type == "math":
-            return self._make_equation(token)
-        elif token_type == "table":
-            return self._make_table(token)
-        elif token_type == "image":
-            return self._make_image(token)
-
-        return None
-
-    def _make_heading(self, token: Dict[str, Any]) -> Dict[str, Any]:
-        """创建标题 Block"""
-        level = token.get("attrs", {}).get("level", 1)
-        level = min(max(level, 1), 6)  # 限制 1-6
-        block_type = self.BLOCK_TYPE_HEADING1 + level - 1
-
-        elements = self._extract_text_elements(token.get("children", []))
-
-        heading_key = f"heading{level}"
+        # 最长前缀为 8 个字符，只需小写前 8 个字符
+        return url.strip()[:8].lower().startswith(_REMOTE_PREFIXES)
+
+    def _convert_token(
+            self, token: Dict[str, Any]
+    ) -> Union[Dict[str, Any], Iterator[Dict[str, Any]], None]:
+        """转换单个 token（按 token 类型查表分发）"""
+        name = self._TOKEN_HANDLERS.get(token.get("type"))
+        return getattr(self, name)(token) if name else None
+
+    def _make_heading(self, token: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """创建标题 Block（无内容时返回 None）"""
+        elements = self._extract_text_elements(token.get("children") or _EMPTY_LIST)
+        if not elements:
+            return None
+
+        level = (token.get("attrs") or _EMPTY_DICT).get("level", 1)
+        index = min(max(level, 1), 6) - 1  # 限制 1-6
         return {
-            "block_type": block_type,
-            heading_key: {"elements": elements},
+            "block_type": self._HEADING_BLOCK_TYPES[index],
+            self._HEADING_KEYS[index]: {"elements": elements},
         }
 
-    def _make_paragraph(self, token: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """创建段落 Block (支持中途插入图片并分割)"""
-        children = token.get("children", [])
-        blocks = []
-        current_elements = []
+    def _make_paragraph(self, token: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """逐个生成段落 Block (支持中途插入图片并分割)"""
+        children = token.get("children") or _EMPTY_LIST
+        # 快速路径：纯文本段落（最常见）直接生成 text_run，跳过通用提取流程
+        if len(children) == 1 and children[0].get("type") == "text":
+            child = children[0]
+            yield {
+                "block_type": BLOCK_TYPE_TEXT,
+                "text": {"elements": _text_runs(child.get("text") or child.get("raw", ""), {})},
+            }
+            return
+
+        # 连续的非图片子节点整段提取，避免逐个子节点包装成单元素列表
+        inline_start = 0
 
-        for child in children:
+        for i, child in enumerate(children):
             if child.get("type") == "image":
-                if current_elements:
-                    blocks.append({
-                        "block_type": self.BLOCK_TYPE_TEXT,
-                        "text": {"elements": current_elements},
-                    })
-                    current_elements = []
+                if i > inline_start:
+                    text_block = self._make_text_block(children[inline_start:i])
+                    if text_block:
+                        yield text_block
+                inline_start = i + 1
 
                 img_block = self._make_image(child)
                 if img_block:
-                    blocks.append(img_block)
-            else:
-                current_elements.extend(self._extract_text_elements([child]))
-
-        if current_elements:
-            blocks.append({
-                "block_type": self.BLOCK_TYPE_TEXT,
-                "text": {"elements": current_elements},
-            })
-
-        return blocks
+                    yield img_block
+
+        if inline_start < len(children):
+            # 无图片时（最常见）直接使用原 children，不做切片
+            text_block = self._make_text_block(children[inline_start:] if inline_start else children)
+            if text_block:
+                yield text_block
+
+    def _make_text_block(self, inline_children: List[Dict]) -> Optional[Dict[str, Any]]:
+        """提取一段行内节点为文本 Block（无内容时返回 None）"""
+        elements = self._extract_text_elements(inline_children)
+        if not elements:
+            return None
+        return {
+            "block_type": BLOCK_TYPE_TEXT,
+            "text": {"elements": elements},
+        }
 
     def _make_image(self, token: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """处理图片"""
-        url = token.get("attrs", {}).get("url", "")
+        url = (token.get("attrs") or _EMPTY_DICT).get("url", "")
         if not url:
             return None
 
         if self._is_remote_url(url):
             return {
-                "block_type": self.BLOCK_TYPE_TEXT,
+                "block_type": BLOCK_TYPE_TEXT,
                 "text": {
                     "elements": [
                         {
@@ -250,73 +494,73 @@ class MarkdownToBlocks:
 
         self.image_paths.append(url)
         return {
-            "block_type": self.BLOCK_TYPE_IMAGE,
+            "block_type": BLOCK_TYPE_IMAGE,
             "image": {},
         }
 
-    def _make_list(self, token: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """创建列表 Block（每个列表项一个 Block）"""
-        ordered = token.get("attrs", {}).get("ordered", False)
-        block_type = self.BLOCK_TYPE_ORDERED if ordered else self.BLOCK_TYPE_BULLET
+    def _make_list(self, token: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """逐个生成列表 Block（每个列表项一个 Block）"""
+        ordered = (token.get("attrs") or _EMPTY_DICT).get("ordered", False)
+        block_type = BLOCK_TYPE_ORDERED if ordered else BLOCK_TYPE_BULLET
         list_key = "ordered" if ordered else "bullet"
 
-        blocks = []
-        for item in token.get("children", []):
+        for item in token.get("children") or _EMPTY_LIST:
             if item.get("type") == "list_item":
-                elements = []
-                image_blocks: List[Dict[str, Any]] = []
-                for child in item.get("children", []):
-                    if child.get("type") in ["paragraph", "block_text"]:
-                        for sub in child.get("children", []):
-                            if sub.get("type") == "image":
-                                img_block = self._make_image(sub)
-                                if img_block:
-                                    image_blocks.append(img_block)
-                            else:
-                                elements.extend(self._extract_text_elements([sub]))
+                # 展平列表项内各段落的行内节点，图片单独成块，其余一次性提取文本
+                subs = list(chain.from_iterable(
+                    child.get("children") or _EMPTY_LIST
+                    for child in item.get("children") or _EMPTY_LIST
+                    if child.get("type") in ("paragraph", "block_text")
+                ))
+                image_blocks = [
+                    img_block
+                    for img_block in map(self._make_image, [sub for sub in subs if sub.get("type") == "image"])
+                    if img_block
+                ]
+                elements = self._extract_text_elements([sub for sub in subs if sub.get("type") != "image"])
 
                 if elements:
-                    blocks.append({
+                    yield {
                         "block_type": block_type,
                         list_key: {"elements": elements},
-                    })
-                if image_blocks:
-                    blocks.extend(image_blocks)
-
-        return blocks
+                    }
+                yield from image_blocks
 
     def _make_code_block(self, token: Dict[str, Any]) -> Dict[str, Any]:
         """创建代码块 Block"""
         raw_text = token.get("raw", "")
-        lang = token.get("attrs", {}).get("info", "").lower()
-        lang_code = self.LANGUAGE_MAP.get(lang, 1)  # 1 = PlainText
+        info = (token.get("attrs") or _EMPTY_DICT).get("info") or ""
+        # 常见情况 info 已是小写，一次查表命中；否则再小写查找。1 = PlainText
+        lang_code = self._LANG_ALIASES.get(info) or self._LANG_ALIASES.get(info.lower(), 1)
 
         return {
-            "block_type": self.BLOCK_TYPE_CODE,
+            "block_type": BLOCK_TYPE_CODE,
             "code": {
                 "elements": [{"text_run": {"content": raw_text}}],
                 "style": {"language": lang_code},
             },
         }
 
-    def _make_quote(self, token: Dict[str, Any]) -> Dict[str, Any]:
-        """创建引用 Block"""
-        elements = []
-        for child in token.get("children", []):
-            if child.get("type") == "paragraph":
-                elements.extend(
-                    self._extract_text_elements(child.get("children", []))
-                )
+    def _make_quote(self, token: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """创建引用 Block（无内容时返回 None）"""
+        elements = list(chain.from_iterable(
+            self._extract_text_elements(child.get("children") or _EMPTY_LIST)
+            for child in token.get("children") or _EMPTY_LIST
+            if child.get("type") == "paragraph"
+        ))
+
+        if not elements:
+            return None
 
         return {
-            "block_type": self.BLOCK_TYPE_QUOTE,
+            "block_type": BLOCK_TYPE_QUOTE,
             "quote": {"elements": elements},
         }
 
-    def _make_divider(self) -> Dict[str, Any]:
+    def _make_divider(self, token: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """创建分割线 Block"""
         return {
-            "block_type": self.BLOCK_TYPE_DIVIDER,
+            "block_type": BLOCK_TYPE_DIVIDER,
             "divider": {},
         }
 
@@ -324,34 +568,19 @@ class MarkdownToBlocks:
         """飞书公式编辑器不支持部分命令，进行替换"""
         if not content:
             return ""
-        content = re.sub(r"\\operatorname\s*{([^}]*)}", r"\\text{\1}", content)
-        content = re.sub(r"\\tag\s*{([^}]*)}", r"(\1)", content)
-        content = re.sub(
-            r"\\text\s*{([^}]*)}",
-            lambda m: (
-                f"\\mathrm{{{m.group(1)}}}"
-                if ("_" in m.group(1) or "^" in m.group(1))
-                else m.group(0)
-            ),
-            content,
-        )
-        content = re.sub(
-            r"\\mathring\s*{\s*\\mathrm\s*(?:{\s*A\s*}|A)\s*}",
-            r"\\AA",
-            content,
-        )
-        content = re.sub(r"\\mathring\s*{\s*A\s*}", r"\\AA", content)
-        content = re.sub(r"\\mathring\s*{([^}]*)}", r"\1", content)
-        return content
+        if "\\" not in content:
+            # 所有规则都以反斜杠开头，无反斜杠时无需替换（如 a+b、x^2）
+            return content
+        return _sanitize_latex_cached(content)
 
     def _make_equation(self, token: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """创建数学公式 Block"""
-        content = token.get("attrs", {}).get("content", "") or token.get("raw", "").strip("$").strip()
+        content = (token.get("attrs") or _EMPTY_DICT).get("content", "") or token.get("raw", "").strip("$").strip()
         content = self._sanitize_latex(content)
         if not content:
             return None
         return {
-            "block_type": self.BLOCK_TYPE_TEXT,
+            "block_type": BLOCK_TYPE_TEXT,
             "text": {
                 "style": {"align": 2},
                 "elements": [
@@ -369,6 +598,12 @@ class MarkdownToBlocks:
             - 文字/链接/行内公式 -> Text block elements
             - 图片 -> Image block（必要时拆分前后文字）
             """
+            if not cell_children:
+                return [_empty_text_block()]
+            # 快速路径：不含图片的单元格（最常见）整体提取为一个文本 Block
+            if not any(c.get("type") == "image" for c in cell_children):
+                return [self._make_text_block(cell_children) or _empty_text_block()]
+
             blocks: List[Dict[str, Any]] = []
             inline_buffer: List[Dict[str, Any]] = []
 
@@ -378,7 +613,7 @@ class MarkdownToBlocks:
                     return
                 elements = self._extract_text_elements(inline_buffer)
                 blocks.append({
-                    "block_type": self.BLOCK_TYPE_TEXT,
+                    "block_type": BLOCK_TYPE_TEXT,
                     "text": {"elements": elements},
                 })
                 inline_buffer = []
@@ -395,10 +630,7 @@ class MarkdownToBlocks:
             flush_inline()
 
             if not blocks:
-                blocks.append({
-                    "block_type": self.BLOCK_TYPE_TEXT,
-                    "text": {"elements": []},
-                })
+                blocks.append(_empty_text_block())
             return blocks
 
         def normalize_rows(table_token: Dict[str, Any]) -> List[List[Dict[str, Any]]]:
@@ -408,11 +640,11 @@ class MarkdownToBlocks:
             - table_head: 可能直接是 table_cell 列表（单行表头），也可能是 table_row 列表
             """
             rows: List[List[Dict[str, Any]]] = []
-            for part in table_token.get("children", []) or []:
+            for part in table_token.get("children") or _EMPTY_LIST:
                 part_type = part.get("type")
 
                 if part_type == "table_head":
-                    head_children = part.get("children", []) or []
+                    head_children = part.get("children") or _EMPTY_LIST
                     if not head_children:
                         continue
                     # mistune 3.2+ 可能将表头直接展开成 table_cell 列表（单行）
@@ -422,14 +654,14 @@ class MarkdownToBlocks:
                     # 兼容 table_row
                     for row in head_children:
                         if row.get("type") == "table_row":
-                            rows.append(row.get("children", []) or [])
+                            rows.append(row.get("children") or _EMPTY_LIST)
                         elif row.get("type") == "table_cell":
                             rows.append([row])
 
                 if part_type == "table_body":
-                    for row in part.get("children", []) or []:
+                    for row in part.get("children") or _EMPTY_LIST:
                         if row.get("type") == "table_row":
-                            rows.append(row.get("children", []) or [])
+                            rows.append(row.get("children") or _EMPTY_LIST)
                         elif row.get("type") == "table_cell":
                             rows.append([row])
 
@@ -439,20 +671,19 @@ class MarkdownToBlocks:
         row_count = len(rows)
         col_count = max((len(r) for r in rows), default=0)
 
-        cell_blocks: List[Dict[str, Any]] = []
-        for r in range(row_count):
-            row = rows[r]
-            for c in range(col_count):
-                cell_token = row[c] if c < len(row) else None
-                cell_children_tokens = (cell_token or {}).get("children", []) if cell_token else []
-                cell_blocks.append({
-                    "block_type": self.BLOCK_TYPE_TABLE_CELL,
-                    "table_cell": {},
-                    "children": table_cell_children(cell_children_tokens),
-                })
+        # 每行补齐到 col_count 列，缺失单元格按空内容处理
+        cell_blocks: List[Dict[str, Any]] = [
+            {
+                "block_type": BLOCK_TYPE_TABLE_CELL,
+                "table_cell": {},
+                "children": table_cell_children((cell.get("children") or _EMPTY_LIST) if cell else _EMPTY_LIST),
+            }
+            for row in rows
+            for cell in chain(row, repeat(None, col_count - len(row)))
+        ]
 
         return {
-            "block_type": self.BLOCK_TYPE_TABLE,
+            "block_type": BLOCK_TYPE_TABLE,
             "table": {"property": {"row_size": row_count, "column_size": col_count}},
             "children": cell_blocks,
         }
@@ -462,73 +693,78 @@ class MarkdownToBlocks:
             children: List[Dict],
             style: Optional[Dict] = None,
     ) -> List[Dict[str, Any]]:
-        """从 children 递归提取文本元素"""
+        """从 children 提取文本元素（显式栈迭代，避免嵌套样式的递归开销）"""
         elements = []
-        if style is None:
-            style = {}
-        style = {k: v for k, v in style.items() if v}
-
-        for child in children:
-            child_type = child.get("type")
-
-            if child_type in ["text", "codespan"]:
-                text_content = child.get("text") or child.get("raw", "")
-                text_content = text_content.replace("\r\n", " ").replace("\n", " ").replace("\r", " ")
-
-                current_style = style.copy()
-                if child_type == "codespan":
-                    current_style["inline_code"] = True
-
-                limit = 2000
-                if len(text_content) > limit:
-                    for i in range(0, len(text_content), limit):
-                        elements.append({
+        append = elements.append  # 热循环内绑定为局部变量
+        extend = elements.extend
+        sanitize = self._sanitize_latex
+        # 样式以不可变元组表示（link 只存 URL），挂到 text_run 时才经缓存转为 dict
+        style_key = tuple(
+            (k, v.get("url", "") if k == "link" else v)
+            for k, v in (style or _EMPTY_DICT).items() if v
+        )
+        # 栈元素：(子节点迭代器, 当前样式键)
+        stack = [(iter(children), style_key)]
+        push = stack.append
+
+        while stack:
+            child_iter, style_key = stack[-1]
+            for child in child_iter:
+                child_type = child.get("type")
+
+                if child_type in ["text", "codespan"]:
+                    current_style = _canon_style(
+                        _with_style(style_key, "inline_code", True) if child_type == "codespan" else style_key
+                    )
+                    extend(_text_runs(child.get("text") or child.get("raw", ""), current_style))
+
+                elif child_type in _INLINE_STYLE_FLAGS:
+                    # strong / emphasis / strikethrough：查表得到样式键后下钻
+                    flag = _INLINE_STYLE_FLAGS[child_type]
+                    push((iter(child.get("children") or _EMPTY_LIST), _with_style(style_key, flag, True)))
+                    break
+
+                elif child_type == "link":
+                    url = (child.get("attrs") or _EMPTY_DICT).get("url", "")
+                    new_style = _with_style(style_key, "link", url)
+                    link_children = child.get("children")
+                    if not link_children:
+                        append({
                             "text_run": {
-                                "content": text_content[i:i + limit],
-                                "text_element_style": current_style,
+                                "content": url,
+                                "text_element_style": _canon_style(new_style),
                             }
                         })
-                else:
-                    elements.append({
-                        "text_run": {
-                            "content": text_content,
-                            "text_element_style": current_style,
-                        }
-                    })
-
-            elif child_type == "strong":
-                new_style = style.copy()
-                new_style["bold"] = True
-                elements.extend(self._extract_text_elements(child.get("children", []), new_style))
-
-            elif child_type == "emphasis":
-                new_style = style.copy()
-                new_style["italic"] = True
-                elements.extend(self._extract_text_elements(child.get("children", []), new_style))
-
-            elif child_type == "strikethrough":
-                new_style = style.copy()
-                new_style["strikethrough"] = True
-                elements.extend(self._extract_text_elements(child.get("children", []), new_style))
-
-            elif child_type == "link":
-                new_style = style.copy()
-                url = child.get("attrs", {}).get("url", "")
-                new_style["link"] = {"url": url}
-                if not child.get("children"):
-                    elements.append({
-                        "text_run": {
-                            "content": url,
-                            "text_element_style": new_style,
-                        }
-                    })
-                else:
-                    elements.extend(self._extract_text_elements(child.get("children", []), new_style))
-
-            elif child_type in ["math", "inline_math"]:
-                math_content = child.get("attrs", {}).get("content", "") or child.get("raw", "").strip("$")
-                math_content = self._sanitize_latex(math_content)
-                if math_content:
-                    elements.append({"equation": {"content": math_content}})
+                    else:
+                        push((iter(link_children), new_style))
+                        break
+
+                elif child_type in ["math", "inline_math"]:
+                    math_content = (child.get("attrs") or _EMPTY_DICT).get("content", "") or child.get("raw", "").strip("$")
+                    math_content = sanitize(math_content)
+                    if math_content:
+                        append({"equation": {"content": math_content}})
+            else:
+                # 当前层遍历完毕，回到上一层继续
+                stack.pop()
 
         return elements
+
+    # token 类型 -> builder 方法名（按名称经 getattr 分发，子类重写 _make_* 仍然生效）
+    _TOKEN_HANDLERS = {
+        "heading": "_make_heading",
+        "paragraph": "_make_paragraph",
+        "list": "_make_list",
+        "block_code": "_make_code_block",
+        "block_quote": "_make_quote",
+        "thematic_break": "_make_divider",
+        "block_math": "_make_equation",
+        "math": "_make_equation",
+        "table": "_make_table",
+        "image": "_make_image",
+    }
+
+
+def _convert_file_worker(file_path: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """进程池 worker：在子进程内转换单个文件（需为模块级函数以便 pickle）"""
+    return MarkdownToBlocks().convert_file(file_path)
@@ -2,13 +2,17 @@
 # -*- coding: utf-8 -*-
 # =====================================================
 # @File   ：exporter.py
-# @Date   ：2026/01/28 19:30
+# @Date   ：2026/10/16 10:00
 # @Author ：leemysw
 # 2025/01/09 18:30   Create
 # 2026/01/28 12:05   Use safe console output
 # 2026/01/28 16:00   Add whiteboard metadata export support
 # 2026/01/28 19:00   Add support for old doc format (/doc/)
 # 2026/01/28 19:30   Support both /sheet/ and /sheets/ URL formats
+# 2026/10/16 10:00   Add streaming export_content_iter
+# 2026/10/16 10:00   Cache URL parsing, make DocumentInfo immutable
+# 2026/10/16 10:00   Respect silent for the export success line
+# 2026/10/16 10:00   Run export_content_iter parsers silently
 # =====================================================
 """
 [INPUT]: 依赖 feishu_docx.core.parsers 的解析器，依赖 feishu_docx.auth 的认证器
@@ -19,8 +23,9 @@
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Iterator, Literal, Optional
 
 from feishu_docx.auth.oauth import OAuth2Authenticator
 from feishu_docx.core.parsers.bitable import BitableParser
@@ -35,7 +40,7 @@ console = get_console()
 # ==============================================================================
 # URL 解析结果
 # ==============================================================================
-@dataclass
+@dataclass(frozen=True)
 class DocumentInfo:
     """文档信息"""
     doc_type: str  # "docx", "sheet", "bitable", "wiki"
@@ -156,14 +161,7 @@ class FeishuExporter:
         Raises:
             ValueError: 不支持的 URL 格式
         """
-        for doc_type, pattern in self.URL_PATTERNS.items():
-            match = pattern.search(url)
-            if match:
-                # 支持多个域名，ID 可能在 group(1) 或 group(2)
-                doc_id = match.group(1) or match.group(2)
-                return DocumentInfo(doc_type=doc_type, doc_id=doc_id)
-
-        raise ValueError(f"不支持的 URL 格式: {url}")
+        return _parse_url(url)
 
     def export(
             self,
@@ -225,7 +223,8 @@ class FeishuExporter:
         output_path = output_dir / f"{output_filename}.md"
         output_path.write_text(content, encoding="utf-8")
 
-        console.print(f"[green]✓ 导出成功:[/green] {output_path}")
+        if not silent:
+            console.print(f"[green]✓ 导出成功:[/green] {output_path}")
 
         # 如果资源目录为空，删除它
         if not any(assets_dir.iterdir()):
@@ -259,6 +258,37 @@ class FeishuExporter:
             export_board_metadata=export_board_metadata
         )
 
+    def export_content_iter(
+            self,
+            url: str,
+            table_format: Literal["html", "md"] = "html",
+            export_board_metadata: bool = False,
+    ) -> Iterator[str]:
+        """
+        流式导出飞书文档为 Markdown 片段（不保存到文件）
+
+        docx 文档按顶层 Block 逐段产出，其他类型整体产出一次。
+        调用方通常边迭代边写 stdout，因此解析器以静默模式运行，不启动 Rich 进度条。
+
+        Args:
+            url: 飞书文档 URL
+            table_format: 表格输出格式
+            export_board_metadata: 是否导出画板节点元数据
+
+        Yields:
+            Markdown 片段
+        """
+        doc_info = self.parse_url(url)
+        access_token = self.get_access_token()
+        parser = self._create_parser(
+            doc_info, access_token, table_format, assets_dir=None,
+            silent=True, export_board_metadata=export_board_metadata
+        )
+        if isinstance(parser, DocumentParser):
+            yield from parser.parse_iter()
+        else:
+            yield parser.parse()
+
     def _parse_document(
             self,
             doc_info: DocumentInfo,
@@ -270,8 +300,28 @@ class FeishuExporter:
             with_block_ids: bool = False,
             export_board_metadata: bool = False,
     ) -> str:
+        """核心解析逻辑，返回 Markdown 内容"""
+        parser = self._create_parser(
+            doc_info, access_token, table_format, assets_dir,
+            silent=silent, progress_callback=progress_callback,
+            with_block_ids=with_block_ids,
+            export_board_metadata=export_board_metadata,
+        )
+        return parser.parse()
+
+    def _create_parser(
+            self,
+            doc_info: DocumentInfo,
+            access_token: str,
+            table_format: Literal["html", "md"],
+            assets_dir: Optional[Path],
+            silent: bool = False,
+            progress_callback=None,
+            with_block_ids: bool = False,
+            export_board_metadata: bool = False,
+    ) -> DocumentParser | SheetParser | BitableParser:
         """
-        核心解析逻辑
+        根据文档类型创建解析器
 
         Args:
             doc_info: 文档信息
@@ -284,14 +334,14 @@ class FeishuExporter:
             export_board_metadata: 是否导出画板节点元数据
 
         Returns:
-            Markdown 内容
+            对应文档类型的解析器实例
         """
         # 如果有资源目录，更新 SDK 的临时目录
         if assets_dir:
             self.sdk.temp_dir = assets_dir
 
         if doc_info.doc_type in ("doc", "docx"):
-            parser = DocumentParser(
+            return DocumentParser(
                 document_id=doc_info.doc_id,
                 user_access_token=access_token,
                 table_mode=table_format,
@@ -302,10 +352,9 @@ class FeishuExporter:
                 with_block_ids=with_block_ids,
                 export_board_metadata=export_board_metadata,
             )
-            return parser.parse()
 
         elif doc_info.doc_type == "sheet":
-            parser = SheetParser(
+            return SheetParser(
                 spreadsheet_token=doc_info.doc_id,
                 user_access_token=access_token,
                 table_mode=table_format,
@@ -313,10 +362,9 @@ class FeishuExporter:
                 silent=silent,
                 progress_callback=progress_callback,
             )
-            return parser.parse()
 
         elif doc_info.doc_type == "bitable":
-            parser = BitableParser(
+            return BitableParser(
                 app_token=doc_info.doc_id,
                 user_access_token=access_token,
                 table_mode=table_format,
@@ -324,7 +372,6 @@ class FeishuExporter:
                 silent=silent,
                 progress_callback=progress_callback,
             )
-            return parser.parse()
 
         elif doc_info.doc_type == "wiki":
             # Wiki 需要先获取实际文档信息
@@ -332,7 +379,7 @@ class FeishuExporter:
             obj_type = node.obj_type  # "doc", "sheet", "bitable"
 
             if obj_type in ("doc", "docx"):
-                parser = DocumentParser(
+                return DocumentParser(
                     document_id=node.obj_token,
                     user_access_token=access_token,
                     table_mode=table_format,
@@ -342,9 +389,8 @@ class FeishuExporter:
                     progress_callback=progress_callback,
                     export_board_metadata=export_board_metadata,
                 )
-                return parser.parse()
             elif obj_type == "sheet":
-                parser = SheetParser(
+                return SheetParser(
                     spreadsheet_token=node.obj_token,
                     user_access_token=access_token,
                     table_mode=table_format,
@@ -352,9 +398,8 @@ class FeishuExporter:
                     silent=silent,
                     progress_callback=progress_callback,
                 )
-                return parser.parse()
             elif obj_type == "bitable":
-                parser = BitableParser(
+                return BitableParser(
                     app_token=node.obj_token,
                     user_access_token=access_token,
                     table_mode=table_format,
@@ -362,7 +407,6 @@ class FeishuExporter:
                     silent=silent,
                     progress_callback=progress_callback,
                 )
-                return parser.parse()
             else:
                 raise ValueError(f"不支持的 Wiki 节点类型: {obj_type}")
 
@@ -395,3 +439,16 @@ class FeishuExporter:
         name = re.sub(r'[<>:"/\\|?*]', '_', name)
         name = name.strip('. ')
         return name or "untitled"
+
+
+@lru_cache(maxsize=512)
+def _parse_url(url: str) -> DocumentInfo:
+    """URL 解析（纯函数，按 URL 缓存；DocumentInfo 不可变，可安全共享）"""
+    for doc_type, pattern in FeishuExporter.URL_PATTERNS.items():
+        match = pattern.search(url)
+        if match:
+            # 支持多个域名，ID 可能在 group(1) 或 group(2)
+            doc_id = match.group(1) or match.group(2)
+            return DocumentInfo(doc_type=doc_type, doc_id=doc_id)
+
+    raise ValueError(f"不支持的 URL 格式: {url}")
@@ -2,11 +2,12 @@
 # -*- coding: utf-8 -*-
 # =====================================================
 # @File   ：document.py
-# @Date   ：2026/01/28 16:00
+# @Date   ：2026/10/16 10:00
 # @Author ：leemysw
 # 2025/01/09 18:30   Create
 # 2026/01/28 12:05   Use safe console output
 # 2026/01/28 16:00   Add whiteboard metadata export support
+# 2026/10/16 10:00   Add streaming parse_iter
 # =====================================================
 """
 [INPUT]: 依赖 feishu_docx.core.sdk 的 FeishuSDK, 依赖 feishu_docx.schema 的数据模型
@@ -16,7 +17,7 @@
 """
 
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import unquote
 
 from lark_oapi.api.docx.v1 import Block
@@ -139,24 +140,46 @@ class DocumentParser:
         Returns:
             Markdown 格式的文档内容
         """
+        return "".join(self.parse_iter())
+
+    def parse_iter(self) -> Iterator[str]:
+        """
+        流式解析文档为 Markdown，按顶层 Block 逐段产出
+
+        拼接结果与 parse() 完全一致，适合直接写入 stdout 等流式场景。
+
+        Yields:
+            Markdown 片段
+        """
         pm = self.pm
+        root = self.root_block
 
-        if not self.root_block:
+        if not root:
             pm.log("[yellow]> 未找到根 Block，无法解析文档[/yellow]")
-            return ""
+            return
 
         total_blocks = len(self.blocks_map)
 
         # 阶段4: 渲染 Markdown
         with pm.bar("渲染 Markdown...", total_blocks) as advance:
-            title = self._render_text_payload(self.root_block.page)
-            body = self._recursive_render(self.root_block, advance=advance)
+            title = self._render_text_payload(root.page)
+            yield f"# {title}\n"
+
+            if root.block_type != BlockType.PAGE:
+                # 非 PAGE 根节点（兜底情况）：整体渲染
+                yield self._recursive_render(root, advance=advance)
+            else:
+                advance()
+                sep = ""
+                for child in self._get_sub_blocks(root):
+                    child_text = self._recursive_render(child, 1, advance)
+                    if child_text:
+                        yield sep + child_text
+                        sep = "\n\n"
 
         pm.log(f"  [dim]渲染完成 ({total_blocks} blocks)[/dim]")
         pm.report("渲染完成", total_blocks, total_blocks)
 
-        return f"# {title}\n{body}"
-
     def _get_sub_blocks(self, block: Block) -> List[Block]:
         """获取 block 的子 Block 列表"""
         if not block.children:
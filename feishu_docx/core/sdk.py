@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 # =====================================================
 # @File   ：sdk.py
-# @Date   ：2026/01/28 18:00
+# @Date   ：2026/10/16 10:00
 # @Author ：leemysw
 # 2025/01/09 18:30   Create
 # 2026/01/28 10:20   Add image upload helpers and chunked create
@@ -10,6 +10,8 @@
 # 2026/01/28 13:20   Add block children fetch helper
 # 2026/01/28 16:00   Add whiteboard metadata export support
 # 2026/01/28 18:00   Add APaaS and Wiki extended APIs
+# 2026/10/16 10:00   Cache wiki node lookups per SDK instance
+# 2026/10/16 10:00   Route create_blocks chunk debug output through logging
 # =====================================================
 """
 [INPUT]: 依赖 lark_oapi 的飞书 SDK，依赖 feishu_docx.schema.models 的数据模型
@@ -19,10 +21,11 @@
 """
 
 import json
+import logging
 import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import lark_oapi as lark
 from lark_oapi.api.bitable.v1 import (
@@ -53,6 +56,7 @@ from feishu_docx.utils.console import get_console
 from feishu_docx.utils.render_table import convert_to_html, convert_to_markdown
 
 console = get_console()
+logger = logging.getLogger(__name__)
 
 
 class FeishuSDK:
@@ -84,6 +88,8 @@ class FeishuSDK:
         # 临时文件目录
         self.temp_dir = temp_dir or Path(tempfile.gettempdir()) / "feishu_docx"
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        # Wiki 节点缓存（同一 SDK 实例内避免重复请求同一节点）
+        self._wiki_node_cache: Dict[Tuple[str, ...], Any] = {}
 
     # ==========================================================================
     # 用户信息
@@ -128,6 +134,10 @@ class FeishuSDK:
         Returns:
             节点信息
         """
+        cache_key = ("metadata", node_token, user_access_token)
+        if cache_key in self._wiki_node_cache:
+            return self._wiki_node_cache[cache_key]
+
         request = (
             GetNodeSpaceRequest.builder()
             .token(node_token)
@@ -141,7 +151,8 @@ class FeishuSDK:
             self._log_error("wiki.v2.space.get_node", response)
             raise RuntimeError("获取知识库节点失败")
 
-        return response.data.node
+        node = self._wiki_node_cache[cache_key] = response.data.node
+        return node
 
     def get_wiki_space_nodes(
             self,
@@ -248,6 +259,10 @@ class FeishuSDK:
         Returns:
             节点信息字典，失败时返回 None
         """
+        cache_key = (obj_type, token, user_access_token)
+        if cache_key in self._wiki_node_cache:
+            return self._wiki_node_cache[cache_key]
+
         request = (
             lark.BaseRequest.builder()
             .http_method(lark.HttpMethod.GET)
@@ -271,7 +286,8 @@ class FeishuSDK:
         try:
             content = response.raw.content.decode("utf-8")
             resp_json = json.loads(content)
-            return resp_json.get("data", {}).get("node", {})
+            node = self._wiki_node_cache[cache_key] = resp_json.get("data", {}).get("node", {})
+            return node
         except Exception as e:
             console.print(f"[red]解析知识空间节点信息失败: {e}[/red]")
             return None
@@ -480,7 +496,7 @@ class FeishuSDK:
             )
             option = lark.RequestOption.builder().user_access_token(user_access_token).build()
 
-            console.print(f"  [DEBUG] Sending chunk {i // chunk_size} (blocks {i} to {i + len(chunk) - 1})...")
+            logger.debug("Sending chunk %d (blocks %d to %d)", i // chunk_size, i, i + len(chunk) - 1)
 
             response: CreateDocumentBlockChildrenResponse = (
                 self.client.docx.v1.document_block_children.create(request, option)
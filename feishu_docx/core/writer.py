@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 # =====================================================
 # @File   ：writer.py
-# @Date   ：2026/01/28 13:25
+# @Date   ：2026/10/16 10:00
 # @Author ：leemysw
 # 2026/01/18 17:55   Create
 # 2026/01/28 10:20   Add image refill pipeline
@@ -10,6 +10,8 @@
 # 2026/01/28 12:45   Use local converter for tables
 # 2026/01/28 13:10   Fill table cells after creation
 # 2026/01/28 13:25   Fetch table cell blocks on demand
+# 2026/10/16 10:00   Upload images concurrently
+# 2026/10/16 10:00   Keep image block edits sequential
 # =====================================================
 """
 飞书文档写入器
@@ -21,6 +23,7 @@
 """
 
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
@@ -30,6 +33,9 @@ from feishu_docx.utils.console import get_console
 
 console = get_console()
 
+# 图片素材上传的最大并发数（回填编辑仍串行）
+_IMAGE_UPLOAD_WORKERS = 8
+
 
 class FeishuWriter:
     """
@@ -366,46 +372,81 @@ class FeishuWriter:
             else:
                 count = len(image_paths)
 
-            for i in range(count):
-                img_url = image_paths[i]
-                img_block = image_blocks[i]
+            # 各图片素材上传互不依赖，并发执行以避免 N 次上传往返串行累加
+            jobs = []
+            for img_url, img_block in zip(image_paths[:count], image_blocks[:count]):
                 block_id = self._block_id(img_block)
-                if not block_id:
-                    continue
-
-                img_path = base_dir / img_url
-                if img_path.exists():
-                    try:
-                        console.print(f"  - 上传图片: [dim]{img_url}[/dim]")
-                        file_token = self.sdk.upload_image(
-                            str(img_path),
-                            block_id,
-                            document_id,
-                            user_access_token,
-                        )
-                        self.sdk.replace_image(
-                            document_id=document_id,
-                            block_id=block_id,
-                            file_token=file_token,
-                            user_access_token=user_access_token,
+                if block_id:
+                    jobs.append((img_url, block_id))
+
+            if jobs:
+                # 仅并发上传素材；replace_image 属于文档编辑，按顺序执行并保持与单元格写入相同的间隔，避免触发频控
+                with ThreadPoolExecutor(max_workers=min(_IMAGE_UPLOAD_WORKERS, len(jobs))) as executor:
+                    futures = [
+                        executor.submit(
+                            self._upload_local_image, document_id, block_id, base_dir, img_url, user_access_token
                         )
-                    except Exception as e:
-                        console.print(f"[red]![/red] 上传图片失败 [dim]{img_url}[/dim]: {e}")
-                        try:
-                            self.sdk.delete_block(document_id, block_id, user_access_token)
-                            console.print(f"  - 已清理占位符 Block [dim]{block_id}[/dim]")
-                        except Exception as delete_err:
-                            console.print(f"  ! 清理占位符失败: {delete_err}")
-                else:
-                    console.print(f"[yellow]![/yellow] 找不到本地图片: [dim]{img_url}[/dim]")
-                    try:
-                        self.sdk.delete_block(document_id, block_id, user_access_token)
-                    except Exception:
-                        pass
+                        for img_url, block_id in jobs
+                    ]
+                    for (img_url, block_id), future in zip(jobs, futures):
+                        self._refill_image(document_id, block_id, img_url, future, user_access_token)
+                        time.sleep(0.35)
 
         console.print("[green]v[/green] 文档同步完成！")
         return created_blocks
 
+    def _upload_local_image(
+            self,
+            document_id: str,
+            block_id: str,
+            base_dir: Path,
+            img_url: str,
+            user_access_token: str,
+    ) -> Optional[str]:
+        """上传本地图片素材，返回 file_token；本地文件不存在时返回 None"""
+        img_path = base_dir / img_url
+        if not img_path.exists():
+            return None
+        console.print(f"  - 上传图片: [dim]{img_url}[/dim]")
+        return self.sdk.upload_image(
+            str(img_path),
+            block_id,
+            document_id,
+            user_access_token,
+        )
+
+    def _refill_image(
+            self,
+            document_id: str,
+            block_id: str,
+            img_url: str,
+            upload: "Future[Optional[str]]",
+            user_access_token: str,
+    ) -> None:
+        """等待上传结果并回填到图片占位 Block，失败时清理占位符"""
+        try:
+            file_token = upload.result()
+            if file_token is None:
+                console.print(f"[yellow]![/yellow] 找不到本地图片: [dim]{img_url}[/dim]")
+                try:
+                    self.sdk.delete_block(document_id, block_id, user_access_token)
+                except Exception:
+                    pass
+                return
+            self.sdk.replace_image(
+                document_id=document_id,
+                block_id=block_id,
+                file_token=file_token,
+                user_access_token=user_access_token,
+            )
+        except Exception as e:
+            console.print(f"[red]![/red] 上传图片失败 [dim]{img_url}[/dim]: {e}")
+            try:
+                self.sdk.delete_block(document_id, block_id, user_access_token)
+                console.print(f"  - 已清理占位符 Block [dim]{block_id}[/dim]")
+            except Exception as delete_err:
+                console.print(f"  ! 清理占位符失败: {delete_err}")
+
     def update_block(
             self,
             document_id: str,
@@ -2,9 +2,10 @@
 # -*- coding: utf-8 -*-
 # =====================================================
 # @File   ：app.py
-# @Date   ：2025/01/09 18:30
+# @Date   ：2026/10/16 10:00
 # @Author ：leemysw
 # 2025/01/09 18:30   Create
+# 2026/10/16 10:00   Reuse exporter (SDK client + token) across exports
 # =====================================================
 """
 [INPUT]: 依赖 textual 的 TUI 框架，依赖 feishu_docx.core.exporter 导出器
@@ -58,6 +59,20 @@ class FeishuDocxApp(App):
         # URL 历史
         self._url_history: list[str] = []
         self._url_history_index: int = -1
+        # 导出器缓存：凭证不变时复用 SDK 客户端与已获取的 Token
+        self._exporter: FeishuExporter | None = None
+        self._exporter_key: tuple | None = None
+
+    def _get_exporter(self, token: str | None, app_id: str | None, app_secret: str | None) -> FeishuExporter:
+        """获取导出器，凭证未变化时复用上一次的实例"""
+        key = (token,) if token else (app_id, app_secret)
+        if self._exporter is None or self._exporter_key != key:
+            if token:
+                self._exporter = FeishuExporter.from_token(token)
+            else:
+                self._exporter = FeishuExporter(app_id=app_id, app_secret=app_secret)
+            self._exporter_key = key
+        return self._exporter
 
     def compose(self) -> ComposeResult:
         # 认证状态
@@ -297,7 +312,7 @@ class FeishuDocxApp(App):
             token = self.query_one("#token-input", Input).value.strip() or os.getenv("FEISHU_ACCESS_TOKEN")
 
             if token:
-                exporter = FeishuExporter.from_token(token)
+                exporter = self._get_exporter(token, None, None)
             else:
                 app_id = self.query_one("#app-id-input", Input).value.strip() or self.config.app_id
                 app_secret = self.query_one("#app-secret-input", Input).value.strip() or self.config.app_secret
@@ -308,7 +323,7 @@ class FeishuDocxApp(App):
                     self.exporting = False
                     return
 
-                exporter = FeishuExporter(app_id=app_id, app_secret=app_secret)
+                exporter = self._get_exporter(None, app_id, app_secret)
 
             output_path = exporter.export(
                 url=url,
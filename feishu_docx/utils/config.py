@@ -2,9 +2,10 @@
 # -*- coding: utf-8 -*-
 # =====================================================
 # @File   ：config.py
-# @Date   ：2025/01/09 18:30
+# @Date   ：2026/10/16 10:00
 # @Author ：leemysw
 # 2025/01/09 18:30   Create
+# 2026/10/16 10:00   Add process-level cached AppConfig.load_cached
 # =====================================================
 """
 [INPUT]: 依赖 pathlib 的路径操作，依赖 json 的序列化
@@ -15,6 +16,7 @@
 
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -70,6 +72,15 @@ class AppConfig:
                 pass  # 配置文件损坏，使用默认值
         return config
 
+    @classmethod
+    def load_cached(cls) -> "AppConfig":
+        """
+        加载配置（进程内缓存）
+
+        返回共享实例，仅用于只读场景；需要修改后保存时请使用 load()
+        """
+        return _load_cached()
+
     def save(self) -> None:
         """保存配置到文件"""
         data = {
@@ -81,6 +92,7 @@ class AppConfig:
             json.dumps(data, indent=2, ensure_ascii=False),
             encoding="utf-8"
         )
+        _load_cached.cache_clear()
 
     def clear(self) -> None:
         """清除配置"""
@@ -89,6 +101,7 @@ class AppConfig:
         self.is_lark = False
         if self._config_file.exists():
             self._config_file.unlink()
+        _load_cached.cache_clear()
 
     def has_credentials(self) -> bool:
         """检查是否已配置凭证"""
@@ -98,3 +111,9 @@ class AppConfig:
     def config_file(self) -> Path:
         """配置文件路径"""
         return self._config_file
+
+
+@lru_cache(maxsize=1)
+def _load_cached() -> AppConfig:
+    """单次进程内只解析一次配置文件，save/clear 时失效"""
+    return AppConfig.load()
@@ -0,0 +1,117 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =====================================================
+# @File   ：test_export_wiki_space.py
+# @Date   ：2026/10/16 10:00
+# @Author ：leemysw
+# 2026/10/16 10:00   Create
+# =====================================================
+"""
+export-wiki-space 增量缓存测试
+
+[INPUT]: 依赖 feishu_docx.cli.main 的 Typer 应用，SDK 与导出器以假对象替换
+[OUTPUT]: 覆盖重命名/移动节点（编辑时间不变）时的重新导出
+[POS]: tests 模块
+[PROTOCOL]: 变更时更新此头部，然后检查 CLAUDE.md
+"""
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from feishu_docx.cli import main as cli_main
+from feishu_docx.core.exporter import FeishuExporter
+
+runner = CliRunner()
+
+
+class FakeSDK:
+    """按父节点返回预置的知识空间节点"""
+
+    def __init__(self, tree: dict):
+        self.tree = tree
+
+    def get_all_wiki_space_nodes(self, space_id, user_access_token, parent_node_token=None):
+        return self.tree.get(parent_node_token, [])
+
+
+class FakeExporter:
+    """写出占位 Markdown 并记录导出调用"""
+
+    def __init__(self, tree: dict, exported: list):
+        self.sdk = FakeSDK(tree)
+        self.exported = exported
+
+    def export(self, url, output_dir, filename, silent=False):
+        path = Path(output_dir) / f"{filename}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(url, encoding="utf-8")
+        self.exported.append(path)
+        return path
+
+
+def _doc(node_token: str, title: str, has_child: bool = False) -> dict:
+    return {
+        "node_token": node_token,
+        "obj_type": "docx",
+        "obj_token": f"obj_{node_token}",
+        "obj_edit_time": "1700000000",
+        "title": title,
+        "has_child": has_child,
+    }
+
+
+@pytest.fixture
+def export_space(monkeypatch, tmp_path):
+    """返回 run(tree) -> 本次导出的相对路径列表"""
+    state = {"tree": {}, "exported": []}
+
+    monkeypatch.setattr(cli_main, "_build_exporter", lambda *args: (None, "token"))
+    monkeypatch.setattr(
+        FeishuExporter,
+        "from_token",
+        classmethod(lambda cls, token: FakeExporter(state["tree"], state["exported"])),
+    )
+
+    def run(tree: dict) -> list:
+        state["tree"].clear()
+        state["tree"].update(tree)
+        state["exported"].clear()
+        result = runner.invoke(cli_main.app, ["export-wiki-space", "space", "-o", str(tmp_path), "-j", "2"])
+        assert result.exit_code == 0, result.output
+        return sorted(p.relative_to(tmp_path).as_posix() for p in state["exported"])
+
+    return run
+
+
+def test_unchanged_node_is_skipped(export_space):
+    tree = {None: [_doc("n1", "Beta")]}
+    assert export_space(tree) == ["Beta.md"]
+    assert export_space(tree) == []
+
+
+def test_renamed_node_is_reexported(export_space, tmp_path):
+    assert export_space({None: [_doc("n1", "Be/ta")]}) == ["Be_ta.md"]
+    assert export_space({None: [_doc("n1", "Gamma")]}) == ["Gamma.md"]
+    assert (tmp_path / "Gamma.md").exists()
+    # 缓存已指向新路径，再次运行应跳过
+    assert export_space({None: [_doc("n1", "Gamma")]}) == []
+
+
+def test_moved_node_is_reexported(export_space, tmp_path):
+    child = _doc("c1", "Child")
+    folder = {
+        "node_token": "f1",
+        "obj_type": "folder",
+        "obj_token": "obj_f1",
+        "title": "Fold",
+        "has_child": True,
+    }
+    before = {None: [_doc("a1", "Alpha", has_child=True), folder], "a1": [child]}
+    after = {None: [_doc("a1", "Alpha"), folder], "f1": [child]}
+
+    assert export_space(before) == ["Alpha/Alpha.md", "Alpha/Child.md"]
+    # Alpha 失去子节点后导出位置变化，Child 移动到 Fold 下，两者都需重新导出
+    assert export_space(after) == ["Alpha.md", "Fold/Child.md"]
+    assert (tmp_path / "Fold" / "Child.md").exists()
@@ -0,0 +1,52 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =====================================================
+# @File   ：test_md_to_blocks.py
+# @Date   ：2026/10/16 10:00
+# @Author ：leemysw
+# 2026/10/16 10:00   Create
+# =====================================================
+"""
+MarkdownToBlocks 输出测试
+
+[INPUT]: 依赖 feishu_docx.core.converters 的 MarkdownToBlocks
+[OUTPUT]: 覆盖返回 Block 之间不共享可变对象
+[POS]: tests 模块
+[PROTOCOL]: 变更时更新此头部，然后检查 CLAUDE.md
+"""
+
+from feishu_docx.core.converters import MarkdownToBlocks
+
+
+def _styles(blocks: list) -> list:
+    return [
+        element["text_run"]["text_element_style"]
+        for block in blocks
+        for payload in block.values()
+        if isinstance(payload, dict)
+        for element in payload.get("elements", [])
+    ]
+
+
+def test_text_element_style_not_shared_across_calls():
+    markdown = "plain **bold** [link](http://example.com)\n\n![img](https://example.com/a.png)"
+    first, _ = MarkdownToBlocks().convert(markdown)
+    for style in _styles(first):
+        style["mutated"] = True
+        style.get("link", {})["url"] = "mutated"
+
+    second, _ = MarkdownToBlocks().convert(markdown)
+    assert _styles(second) == [{}, {"bold": True}, {}, {"link": {"url": "http://example.com"}}, {}]
+
+
+def test_image_and_divider_payloads_not_shared():
+    markdown = "![a](a.png)\n\n---\n\n![b](b.png)\n\n***"
+    first, _ = MarkdownToBlocks().convert(markdown)
+    for block in first:
+        for key in ("image", "divider"):
+            if key in block:
+                block[key]["mutated"] = True
+
+    second, _ = MarkdownToBlocks().convert(markdown)
+    payloads = [block[key] for block in second for key in ("image", "divider") if key in block]
+    assert payloads == [{}, {}, {}, {}]
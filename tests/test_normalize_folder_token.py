@@ -0,0 +1,37 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =====================================================
+# @File   ：test_normalize_folder_token.py
+# @Date   ：2026/10/16 10:00
+# @Author ：leemysw
+# 2026/10/16 10:00   Create
+# =====================================================
+"""
+normalize_folder_token 测试
+
+[INPUT]: 依赖 feishu_docx.cli.main 的 normalize_folder_token
+[OUTPUT]: 覆盖 token / 文件夹 URL / 查询串与锚点中的路径标记
+[POS]: tests 模块
+[PROTOCOL]: 变更时更新此头部，然后检查 CLAUDE.md
+"""
+
+import pytest
+
+from feishu_docx.cli.main import normalize_folder_token
+
+
+@pytest.mark.parametrize(
+    ("folder", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("fldcnAbc123", "fldcnAbc123"),
+        ("https://x.feishu.cn/drive/folder/AbC1", "AbC1"),
+        ("https://x.feishu.cn/drive/folder/AbC1?from=home", "AbC1"),
+        # 查询串与锚点中的路径标记不应被识别
+        ("https://x.feishu.cn/wiki/abc?from=/drive/folder/XYZ", "https://x.feishu.cn/wiki/abc?from=/drive/folder/XYZ"),
+        ("https://x.feishu.cn/wiki#/drive/folder/XYZ", "https://x.feishu.cn/wiki#/drive/folder/XYZ"),
+    ],
+)
+def test_normalize_folder_token(folder, expected):
+    assert normalize_folder_token(folder) == expected